@@ -18,6 +18,29 @@ import os
 import mindspore as ms
 import mindspore.dataset as ds
 
+# the launch scripts export RANK_ID and RANK_SIZE before python starts, so they are read once at the import
+RANK_ID = int(os.getenv("RANK_ID", "0"))
+RANK_SIZE = int(os.getenv("RANK_SIZE", "1"))
+
+
+def scan_dataset_files(data_dir, is_dataset_file):
+    """
+    Recursively collect the dataset files under the directory, the symlinked directories are not followed.
+
+    Args:
+        data_dir (str): The directory of the dataset files.
+        is_dataset_file (Callable[[str], bool]): Whether the file of the given name is a dataset file.
+    """
+    dataset_files = []
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    dataset_files.extend(scan_dataset_files(entry.path, is_dataset_file))
+            elif is_dataset_file(entry.name):
+                dataset_files.append(entry.path)
+    return dataset_files
+
 
 class BaseDataset:
     """Base Dataset."""
@@ -26,7 +49,14 @@ class BaseDataset:
 
     @classmethod
     def init_dataset_config(cls, dataset_config):
-        """Init dataset config."""
+        """
+        Init dataset config.
+
+        The python_multiprocessing of the dataset config decides whether the python transforms of the map
+        operations run in the python processes instead of the threads of the dataset pipeline. Keep it False
+        for the tokenizer only text transforms, since the processes pickle the tokenizer and copy every row
+        across the processes, and only enable it for the heavy python transforms such as the image decoding.
+        """
         ds.config.set_seed(dataset_config.seed)
         ds.config.set_prefetch_size(dataset_config.prefetch_size)
         ds.config.set_numa_enable(dataset_config.numa_enable)
@@ -19,7 +19,7 @@ import mindspore.dataset.transforms.c_transforms as C
 from mindformers.tools.register import MindFormerRegister, MindFormerModuleType
 from mindformers.tools.logger import logger
 from .dataloader import build_dataset_loader
-from .base_dataset import BaseDataset
+from .base_dataset import BaseDataset, RANK_ID, RANK_SIZE, scan_dataset_files
 
 
 @MindFormerRegister.register(MindFormerModuleType.DATASET)
@@ -41,8 +41,8 @@ class CausalLanguageModelDataset(BaseDataset):
     """
     def __new__(cls, dataset_config: dict = None):
         logger.info("Now Create Causal Image Modeling Dataset.")
-        rank_id = int(os.getenv("RANK_ID", "0"))
-        device_num = int(os.getenv("RANK_SIZE", "1"))
+        rank_id = RANK_ID
+        device_num = RANK_SIZE
         cls.init_dataset_config(dataset_config)
         rank_id, device_num = cls._check_device_rank_for_parallel(rank_id, device_num)
         if "data_files" not in dataset_config.data_loader \
@@ -50,10 +50,7 @@ class CausalLanguageModelDataset(BaseDataset):
             dataset_files = []
             data_dir = dataset_config.data_loader.dataset_dir
             if os.path.isdir(data_dir):
-                for r, _, f in os.walk(data_dir):
-                    for file in f:
-                        if file.endswith(".mindrecord"):
-                            dataset_files.append(os.path.join(r, file))
+                dataset_files = scan_dataset_files(data_dir, lambda name: name.endswith(".mindrecord"))
             else:
                 if data_dir.endswith(".mindrecord"):
                     dataset_files.append(data_dir)
@@ -62,14 +59,18 @@ class CausalLanguageModelDataset(BaseDataset):
         dataset_config.data_loader.pop("dataset_dir")
         dataset = build_dataset_loader(
             dataset_config.data_loader, default_args={'dataset_files': dataset_files,
-                                                      'num_shards': device_num, 'shard_id': rank_id})
+                                                      'num_shards': device_num, 'shard_id': rank_id,
+                                                      'num_parallel_workers': dataset_config.num_parallel_workers})
         dataset = dataset.batch(dataset_config.batch_size,
                                 drop_remainder=dataset_config.drop_remainder,
                                 output_columns=dataset_config.input_columns,
                                 num_parallel_workers=dataset_config.num_parallel_workers)
         dataset = dataset.project(columns=dataset_config.input_columns)
         dataset = dataset.repeat(dataset_config.repeat)
+        # the cast is a C++ op on the whole batch, so it runs in the parallel workers of the pipeline
         type_cast_op = C.TypeCast(mstype.int32)
         for input_arg in dataset_config.input_columns:
-            dataset = dataset.map(operations=type_cast_op, input_columns=input_arg)
+            dataset = dataset.map(operations=type_cast_op, input_columns=input_arg,
+                                  num_parallel_workers=dataset_config.num_parallel_workers,
+                                  python_multiprocessing=False)
         return dataset
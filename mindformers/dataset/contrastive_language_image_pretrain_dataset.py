@@ -13,12 +13,10 @@
 # limitations under the License.
 # ============================================================================
 """Contrastive Language Image Pretrain Dataset."""
-import os
-
 from .dataloader import build_dataset_loader
 from .transforms import build_transforms
 from .sampler import build_sampler
-from .base_dataset import BaseDataset
+from .base_dataset import BaseDataset, RANK_ID, RANK_SIZE
 from ..tools import logger
 from ..models.build_tokenizer import build_tokenizer
 from ..tools.register import MindFormerRegister, MindFormerModuleType
@@ -65,8 +63,8 @@ class ContrastiveLanguageImagePretrainDataset(BaseDataset):
         """new method"""
         logger.info("Now Create Contrastive Language Image Pretrain Dataset.")
         cls.init_dataset_config(dataset_config)
-        rank_id = int(os.getenv("RANK_ID", "0"))
-        device_num = int(os.getenv("RANK_SIZE", "1"))
+        rank_id = RANK_ID
+        device_num = RANK_SIZE
 
         dataset = build_dataset_loader(
             dataset_config.data_loader, default_args={'num_shards': device_num, 'shard_id': rank_id})
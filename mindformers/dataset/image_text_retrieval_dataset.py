@@ -13,13 +13,12 @@
 # limitations under the License.
 # ============================================================================
 """Image-text Retrieval Dataset."""
-import os
 import mindspore.common.dtype as mstype
 import mindspore.dataset as ds
 import mindspore.dataset.transforms.c_transforms as C
 from mindformers.tools.register import MindFormerRegister, MindFormerModuleType
 from mindformers.tools.logger import logger
-from .base_dataset import BaseDataset
+from .base_dataset import BaseDataset, RANK_ID, RANK_SIZE
 from .transforms import build_transforms
 
 
@@ -29,8 +28,8 @@ class ImageToTextRetrievalDataset(BaseDataset):
     def __new__(cls, dataset_config: dict = None):
         logger.info("Now Create Image-text Retrieval Dataset.")
         cls.init_dataset_config(dataset_config)
-        rank_id = int(os.getenv("RANK_ID", "0"))
-        device_num = int(os.getenv("RANK_SIZE", "1"))
+        rank_id = RANK_ID
+        device_num = RANK_SIZE
         dataset = ds.MindDataset(dataset_config.data_loader.dataset_dir,
                                  shuffle=dataset_config.data_loader.shuffle,
                                  num_shards=device_num,
@@ -20,7 +20,7 @@ import mindspore.dataset.transforms.c_transforms as C
 from mindformers.tools.register import MindFormerRegister, MindFormerModuleType
 from mindformers.tools.logger import logger
 from .dataloader import build_dataset_loader
-from .base_dataset import BaseDataset
+from .base_dataset import BaseDataset, RANK_ID, RANK_SIZE
 
 
 @MindFormerRegister.register(MindFormerModuleType.DATASET)
@@ -44,8 +44,8 @@ class MaskLanguageModelDataset(BaseDataset):
     """
     def __new__(cls, dataset_config: dict = None):
         logger.info("Now Create Masked Image Modeling Dataset.")
-        rank_id = int(os.getenv("RANK_ID", "0"))
-        device_num = int(os.getenv("RANK_SIZE", "1"))
+        rank_id = RANK_ID
+        device_num = RANK_SIZE
         cls.init_dataset_config(dataset_config)
         rank_id, device_num = cls._check_device_rank_for_parallel(rank_id, device_num)
         if "data_files" not in dataset_config.data_loader \
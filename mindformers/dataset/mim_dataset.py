@@ -13,15 +13,13 @@
 # limitations under the License.
 # ============================================================================
 """Masked Image Modeling Dataset."""
-import os
-
 from mindformers.tools.register import MindFormerRegister, MindFormerModuleType
 from mindformers.tools.logger import logger
 from .dataloader import build_dataset_loader
 from .mask import build_mask
 from .transforms import build_transforms
 from .sampler import build_sampler
-from .base_dataset import BaseDataset
+from .base_dataset import BaseDataset, RANK_ID, RANK_SIZE
 
 
 @MindFormerRegister.register(MindFormerModuleType.DATASET)
@@ -45,8 +43,8 @@ class MIMDataset(BaseDataset):
     def __new__(cls, dataset_config: dict = None):
         logger.info("Now Create Masked Image Modeling Dataset.")
         cls.init_dataset_config(dataset_config)
-        rank_id = int(os.getenv("RANK_ID", "0"))
-        device_num = int(os.getenv("RANK_SIZE", "1"))
+        rank_id = RANK_ID
+        device_num = RANK_SIZE
 
         dataset = build_dataset_loader(
             dataset_config.data_loader, default_args={'num_shards': device_num, 'shard_id': rank_id})
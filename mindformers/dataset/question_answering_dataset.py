@@ -13,8 +13,6 @@
 # limitations under the License.
 # ============================================================================
 """Question Answering Dataset."""
-import os
-
 import mindspore.common.dtype as mstype
 import mindspore.dataset.transforms.c_transforms as C
 
@@ -23,7 +21,7 @@ from mindformers.tools.logger import logger
 from ..models.build_tokenizer import build_tokenizer
 from .sampler import build_sampler
 from .dataloader import build_dataset_loader
-from .base_dataset import BaseDataset
+from .base_dataset import BaseDataset, RANK_ID, RANK_SIZE
 
 
 @MindFormerRegister.register(MindFormerModuleType.DATASET)
@@ -49,8 +47,8 @@ class QuestionAnsweringDataset(BaseDataset):
         """new method"""
         logger.info("Now Create Question Answering Dataset.")
         cls.init_dataset_config(dataset_config)
-        rank_id = int(os.getenv("RANK_ID", "0"))
-        device_num = int(os.getenv("RANK_SIZE", "1"))
+        rank_id = RANK_ID
+        device_num = RANK_SIZE
 
         tokenizer = build_tokenizer(dataset_config.tokenizer)
 
@@ -13,15 +13,13 @@
 # limitations under the License.
 # ============================================================================
 """Token classification Dataset."""
-import os
-
 from mindformers.tools.register import MindFormerRegister, MindFormerModuleType
 from mindformers.tools.logger import logger
 from .dataloader import build_dataset_loader
-from ..models.build_tokenizer import build_tokenizer
+from ..models.build_tokenizer import build_cached_tokenizer
 from .transforms import build_transforms
 from .sampler import build_sampler
-from .base_dataset import BaseDataset
+from .base_dataset import BaseDataset, RANK_ID, RANK_SIZE
 
 
 @MindFormerRegister.register(MindFormerModuleType.DATASET)
@@ -47,13 +45,13 @@ class TokenClassificationDataset(BaseDataset):
         """new method"""
         logger.info("Now Create Token classification Dataset.")
         cls.init_dataset_config(dataset_config)
-        rank_id = int(os.getenv("RANK_ID", "0"))
-        device_num = int(os.getenv("RANK_SIZE", "1"))
+        rank_id = RANK_ID
+        device_num = RANK_SIZE
 
         dataset = build_dataset_loader(
             dataset_config.data_loader, default_args={'num_shards': device_num, 'shard_id': rank_id})
 
-        tokenizer = build_tokenizer(dataset_config.tokenizer)
+        tokenizer = build_cached_tokenizer(dataset_config.tokenizer)
 
         text_transforms = build_transforms(dataset_config.text_transforms,
                                            default_args={"tokenizer": tokenizer})
@@ -65,6 +63,19 @@ class TokenClassificationDataset(BaseDataset):
         if sampler is not None:
             dataset = dataset.use_sampler(sampler)
 
+        if text_transforms is not None and label_transforms is not None:
+            # fuse the label transforms into the text transforms map, so only one map stage is created
+            label_column = dataset_config.input_columns[1]
+            if label_column not in dataset_config.output_columns:
+                raise ValueError(f"The label column {label_column} of the input_columns should be kept in the "
+                                 f"output_columns {dataset_config.output_columns} of the text_transforms, "
+                                 f"since the label_transforms are applied on it.")
+            label_index = dataset_config.output_columns.index(label_column)
+            if not isinstance(text_transforms, list):
+                text_transforms = [text_transforms]
+            text_transforms = text_transforms + [_LabelColumnTransform(label_transforms, label_index)]
+            label_transforms = None
+
         if text_transforms is not None:
             dataset = dataset.map(
                 input_columns=dataset_config.input_columns,
@@ -89,3 +100,20 @@ class TokenClassificationDataset(BaseDataset):
         dataset = dataset.repeat(dataset_config.repeat)
 
         return dataset
+
+
+class _LabelColumnTransform:
+    """Applies the label transforms on the label column among all the columns."""
+    def __init__(self, label_transforms, label_index):
+        if not isinstance(label_transforms, list):
+            label_transforms = [label_transforms]
+        self.label_transforms = label_transforms
+        self.label_index = label_index
+
+    def __call__(self, *columns):
+        columns = list(columns)
+        label = columns[self.label_index]
+        for transform in self.label_transforms:
+            label = transform(label)
+        columns[self.label_index] = label
+        return tuple(columns)
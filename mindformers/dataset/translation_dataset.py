@@ -13,20 +13,25 @@
 # limitations under the License.
 # ============================================================================
 """T5 Dataset."""
+import multiprocessing
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 
 
 import mindspore
 import mindspore.common.dtype as mstype
 import mindspore.dataset.transforms.c_transforms as C
+from mindspore.mindrecord import FileWriter
 
 from mindformers.tools.register import MindFormerRegister, MindFormerModuleType
 from mindformers.tools.logger import logger
 from mindformers.tools.utils import is_version_ge
 from .dataloader import build_dataset_loader
-from .base_dataset import BaseDataset
-from ..auto_class import AutoTokenizer
+from .dataloader.wmt16_dataloader import WMT16DataSet
+from .base_dataset import BaseDataset, RANK_ID, RANK_SIZE, scan_dataset_files
+from ..models.build_tokenizer import build_cached_tokenizer
 
 __all__ = ['TranslationDataset']
 
@@ -36,8 +41,15 @@ class TranslationDataset(BaseDataset):
     def __new__(cls, dataset_config: dict = None):
         logger.info("Now Create T5 Dataset.")
         cls.init_dataset_config(dataset_config)
-        if dataset_config.data_loader.type != 'MindDataset':
+        batch_map_kwargs = {}
+        is_raw_text = dataset_config.data_loader.type != 'MindDataset'
+        # the raw text is tokenized batch by batch unless tokenizer_batched is set to False explicitly
+        dataset_config.tokenizer_batched = dataset_config.tokenizer_batched is not False
+        if is_raw_text:
             dataset = cls._process_raw_text_data(dataset_config)
+            if dataset_config.tokenizer_batched:
+                batch_map_kwargs = {'per_batch_map': cls._tokenizer_batch_map(dataset_config.tokenizer),
+                                    'input_columns': ['source', 'target']}
         else:
             dataset = cls._process_mindrecord_data(dataset_config)
 
@@ -45,78 +57,134 @@ class TranslationDataset(BaseDataset):
                                 drop_remainder=dataset_config.drop_remainder,
                                 column_order=dataset_config.input_columns,
                                 output_columns=dataset_config.input_columns,
-                                num_parallel_workers=dataset_config.num_parallel_workers)
+                                num_parallel_workers=dataset_config.num_parallel_workers,
+                                **batch_map_kwargs)
         dataset = dataset.repeat(dataset_config.repeat)
-        type_cast_op = C.TypeCast(mstype.int32)
-        for input_arg in dataset_config.input_columns:
-            dataset = dataset.map(operations=type_cast_op, input_columns=input_arg)
+        # the tokenized raw text data is already of int32, only the mindrecord data needs the cast
+        if not is_raw_text:
+            type_cast_op = C.TypeCast(mstype.int32)
+            for input_arg in dataset_config.input_columns:
+                dataset = dataset.map(operations=type_cast_op, input_columns=input_arg,
+                                      num_parallel_workers=dataset_config.num_parallel_workers)
         return dataset
 
     @classmethod
     def _tokenizer_map(cls, dataset, tokenizer_config):
         """Maps the tokenizer on the source and the output"""
-        tokenizer = AutoTokenizer.from_pretrained(tokenizer_config.type)
+        tokenizer = build_cached_tokenizer(tokenizer_config.type)
         prefix = tokenizer_config.prefix
         src_max_length = tokenizer_config.src_max_length
         tgt_max_length = tokenizer_config.tgt_max_length
 
+        prefix_ids = _encode_prefix(tokenizer, prefix, src_max_length)
+
         logger.info("Start tokenize on the dataset using tokenizer: %s", tokenizer_config)
         def pad_max_function(src, tgt):
-            src = src.tolist()
-            if isinstance(src, bytes):
-                src = src.decode()
-            output = tokenizer(prefix + src, padding='max_length', max_length=src_max_length, truncation=True)
-
-            tgt = tgt.tolist()
-            if isinstance(tgt, bytes):
-                tgt = tgt.decode()
-            tgt_output = tokenizer(tgt, padding='max_length', max_length=tgt_max_length, truncation=True)
-
-            input_ids = np.array(output['input_ids'], np.int32)
-            attention_mask = np.array(output['attention_mask'], np.float32)
-            labels = np.array(tgt_output['input_ids'], np.int32)
-            return input_ids, attention_mask, labels
+            return _tokenize_row(tokenizer, _to_str(src), _to_str(tgt), src_max_length, tgt_max_length, prefix_ids)
 
+        # the tokenizer runs in the threads of the pipeline, spawning the python processes only pickles it
         if is_version_ge(mindspore.__version__, "2.0.0"):
             dataset = dataset.map(pad_max_function,
                                   input_columns=['source', 'target'],
-                                  output_columns=['input_ids', 'attention_mask', 'labels'])
+                                  output_columns=['input_ids', 'attention_mask', 'labels'],
+                                  python_multiprocessing=False)
             dataset = dataset.project(columns=['input_ids', 'attention_mask', 'labels'])
 
         else:
             dataset = dataset.map(pad_max_function,
                                   input_columns=['source', 'target'],
                                   output_columns=['input_ids', 'attention_mask', 'labels'],
-                                  column_order=['input_ids', 'attention_mask', 'labels'])
+                                  column_order=['input_ids', 'attention_mask', 'labels'],
+                                  python_multiprocessing=False)
         return dataset
 
+    @classmethod
+    def _tokenizer_batch_map(cls, tokenizer_config):
+        """Builds the per_batch_map which tokenizes the sources and the targets of a whole batch at once"""
+        tokenizer = build_cached_tokenizer(tokenizer_config.type)
+        prefix = tokenizer_config.prefix
+        src_max_length = tokenizer_config.src_max_length
+        tgt_max_length = tokenizer_config.tgt_max_length
+        prefix_ids = _encode_prefix(tokenizer, prefix, src_max_length)
+
+        logger.info("Start batch tokenize on the dataset using tokenizer: %s", tokenizer_config)
+        def pad_max_batch(srcs, tgts, batch_info):  # pylint: disable=W0613
+            input_ids, attention_mask, labels = _tokenize_batch(
+                tokenizer, _batch_to_str(srcs), _batch_to_str(tgts), src_max_length, tgt_max_length, prefix_ids)
+            return list(input_ids), list(attention_mask), list(labels)
+
+        return pad_max_batch
+
+    @classmethod
+    def pretokenize_to_mindrecord(cls, dataset_dir, tokenizer_config, output_file,
+                                  stage="train", num_workers=None, chunk_size=10000):
+        """
+        Tokenize the raw text data offline with multiple processes and write it to the mindrecord file,
+        so the training reads the mindrecord data without tokenizing on the dataset pipeline.
+
+        Args:
+            dataset_dir (str): The directory of the raw text data, which is read by the WMT16DataLoader.
+            tokenizer_config (dict): The tokenizer config of the dataset config, a dict or a MindFormerConfig
+                which contains the type, src_max_length, tgt_max_length and optionally the prefix.
+            output_file (str): The path of the output mindrecord file.
+            stage (str): The stage of the raw text data. Default: "train".
+            num_workers (int): The number of the tokenization processes. Default: None, which means
+                half of the cpu cores and at most 8.
+            chunk_size (int): The number of the text pairs tokenized by one process at a time. Default: 10000.
+        """
+        if num_workers is None:
+            num_workers = max(1, min((os.cpu_count() or 1) // 2, 8))
+        pairs = WMT16DataSet(dataset_dir, stage)
+
+        writer = FileWriter(file_name=output_file, shard_num=1, overwrite=True)
+        writer.add_schema({"input_ids": {"type": "int32", "shape": [-1]},
+                           "attention_mask": {"type": "int32", "shape": [-1]},
+                           "labels": {"type": "int32", "shape": [-1]}}, "translation_schema")
+        logger.info("Start pretokenize %d text pairs with %d processes using tokenizer: %s",
+                    len(pairs), num_workers, tokenizer_config)
+        tokenizer_args = (tokenizer_config['type'], tokenizer_config.get('prefix'),
+                          tokenizer_config['src_max_length'], tokenizer_config['tgt_max_length'])
+        # the workers are spawned since forking after the threads of mindspore are started may deadlock them
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_worker_tokenizer, initargs=tokenizer_args) as executor:
+            # the chunks are submitted while the earlier ones are written, so only a few chunks are in memory
+            pending = deque()
+            for start in range(0, len(pairs), chunk_size):
+                chunk = [pairs[i] for i in range(start, min(start + chunk_size, len(pairs)))]
+                pending.append(executor.submit(_tokenize_chunk, chunk))
+                if len(pending) >= 2 * num_workers:
+                    _write_tokenized_chunk(writer, pending.popleft().result())
+            while pending:
+                _write_tokenized_chunk(writer, pending.popleft().result())
+        writer.commit()
+        logger.info("The pretokenized mindrecord file is saved to %s.", output_file)
+
     @classmethod
     def _process_raw_text_data(cls, dataset_config):
         """Process the text data"""
-        rank_id = int(os.getenv("RANK_ID", "0"))
-        device_num = int(os.getenv("RANK_SIZE", "1"))
+        rank_id = RANK_ID
+        device_num = RANK_SIZE
         dataset_dir = dataset_config.data_loader.pop("dataset_dir")
         dataset = build_dataset_loader(
             dataset_config.data_loader, default_args={'dataset_dir': dataset_dir,
                                                       'num_shards': device_num, 'shard_id': rank_id})
 
-        dataset = cls._tokenizer_map(dataset, dataset_config.tokenizer)
+        # the batched tokenization is done by the per_batch_map of the batch operation
+        if not dataset_config.tokenizer_batched:
+            dataset = cls._tokenizer_map(dataset, dataset_config.tokenizer)
         return dataset
 
     @classmethod
     def _process_mindrecord_data(cls, dataset_config):
         """Process the mindrecord data"""
-        rank_id = int(os.getenv("RANK_ID", "0"))
-        device_num = int(os.getenv("RANK_SIZE", "1"))
+        rank_id = RANK_ID
+        device_num = RANK_SIZE
         if "data_files" not in dataset_config.data_loader \
                 and dataset_config.data_loader.dataset_dir:
             dataset_files = []
             data_dir = dataset_config.data_loader.dataset_dir
             if os.path.isdir(data_dir):
-                for r, _, f in os.walk(data_dir):
-                    for file in f:
-                        if not file.endswith("db"):
-                            dataset_files.append(os.path.join(r, file))
+                dataset_files = scan_dataset_files(data_dir, lambda name: not name.endswith("db"))
             else:
                 if not data_dir.endswith("db"):
                     dataset_files.append(data_dir)
@@ -125,7 +193,88 @@ class TranslationDataset(BaseDataset):
         dataset_config.data_loader.pop("dataset_dir")
         logger.info("Using args %s to instance the dataset.", dataset_config.data_loader)
         dataset = build_dataset_loader(
-            dataset_config.data_loader, default_args={'dataset_files': dataset_files[0],
+            dataset_config.data_loader, default_args={'dataset_files': dataset_files,
                                                       'num_shards': device_num, 'shard_id': rank_id,
                                                       'columns_list': dataset_config.input_columns})
         return dataset
+
+
+def _to_str(text):
+    """Converts the text read from the dataset to the python string, decoding the bytes without the tolist copy"""
+    if text.dtype.kind == 'S':
+        return text.tobytes().decode('utf-8')
+    return text.tolist()
+
+
+def _batch_to_str(texts):
+    """Converts a batch of texts read from the dataset to a list of python strings"""
+    texts = np.array(texts)
+    if texts.dtype.kind == 'S':
+        texts = np.char.decode(texts, 'utf-8')
+    return texts.tolist()
+
+
+def _encode_prefix(tokenizer, prefix, src_max_length):
+    """Encodes the prefix once without the special tokens, so it is prepended to the source ids of each sample"""
+    if not prefix:
+        return np.zeros((0,), np.int32)
+    prefix_ids = np.array(tokenizer(prefix, add_special_tokens=False)['input_ids'], np.int32)
+    if prefix_ids.size >= src_max_length:
+        raise ValueError(f"The prefix {prefix} is encoded to {prefix_ids.size} tokens, "
+                         f"which leaves no room for the source within src_max_length {src_max_length}.")
+    return prefix_ids
+
+
+def _tokenize_row(tokenizer, src, tgt, src_max_length, tgt_max_length, prefix_ids):
+    """Tokenizes a source and a target string to the padded int32 arrays, prepending the prefix ids"""
+    output = tokenizer(src, padding='max_length', max_length=src_max_length - prefix_ids.size, truncation=True)
+    tgt_output = tokenizer(tgt, padding='max_length', max_length=tgt_max_length, truncation=True)
+
+    input_ids = np.concatenate((prefix_ids, np.array(output['input_ids'], np.int32)))
+    attention_mask = np.concatenate((np.ones_like(prefix_ids), np.array(output['attention_mask'], np.int32)))
+    labels = np.array(tgt_output['input_ids'], np.int32)
+    return input_ids, attention_mask, labels
+
+
+def _tokenize_batch(tokenizer, srcs, tgts, src_max_length, tgt_max_length, prefix_ids=None):
+    """Tokenizes a batch of source and target strings to the padded int32 arrays, prepending the prefix ids"""
+    num_prefix = 0 if prefix_ids is None else prefix_ids.size
+    output = tokenizer(srcs, padding='max_length', max_length=src_max_length - num_prefix, truncation=True)
+    tgt_output = tokenizer(tgts, padding='max_length', max_length=tgt_max_length, truncation=True)
+
+    input_ids = np.asarray(output['input_ids'], np.int32)
+    attention_mask = np.asarray(output['attention_mask'], np.int32)
+    if num_prefix:
+        batch_size = input_ids.shape[0]
+        input_ids = np.concatenate((np.broadcast_to(prefix_ids, (batch_size, num_prefix)), input_ids), axis=1)
+        attention_mask = np.concatenate((np.ones((batch_size, num_prefix), np.int32), attention_mask), axis=1)
+    labels = np.asarray(tgt_output['input_ids'], np.int32)
+    return input_ids, attention_mask, labels
+
+
+_WORKER_TOKENIZER_ARGS = {}
+
+
+def _init_worker_tokenizer(tokenizer_type, prefix, src_max_length, tgt_max_length):
+    """Builds the tokenizer once in each pretokenization process"""
+    tokenizer = build_cached_tokenizer(tokenizer_type)
+    _WORKER_TOKENIZER_ARGS.update(tokenizer=tokenizer,
+                                  prefix_ids=_encode_prefix(tokenizer, prefix, src_max_length),
+                                  src_max_length=src_max_length,
+                                  tgt_max_length=tgt_max_length)
+
+
+def _tokenize_chunk(pairs):
+    """Tokenizes a chunk of (source, target) pairs in the pretokenization process"""
+    srcs = [src for src, _ in pairs]
+    tgts = [tgt for _, tgt in pairs]
+    return _tokenize_batch(_WORKER_TOKENIZER_ARGS['tokenizer'], srcs, tgts,
+                           _WORKER_TOKENIZER_ARGS['src_max_length'], _WORKER_TOKENIZER_ARGS['tgt_max_length'],
+                           _WORKER_TOKENIZER_ARGS['prefix_ids'])
+
+
+def _write_tokenized_chunk(writer, tokenized_chunk):
+    """Writes the tokenized chunk returned by the pretokenization process to the mindrecord file"""
+    input_ids, attention_mask, labels = tokenized_chunk
+    writer.write_raw_data([{"input_ids": input_ids[i], "attention_mask": attention_mask[i],
+                            "labels": labels[i]} for i in range(len(input_ids))])
@@ -13,11 +13,9 @@
 # limitations under the License.
 # ============================================================================
 """Zero Shot Image Classification Dataset."""
-import os
-
 from .dataloader import build_dataset_loader
 from .transforms import build_transforms
-from .base_dataset import BaseDataset
+from .base_dataset import BaseDataset, RANK_ID, RANK_SIZE
 from ..tools import logger
 from ..tools.register import MindFormerRegister, MindFormerModuleType
 from ..models.build_tokenizer import build_tokenizer
@@ -71,8 +69,8 @@ class ZeroShotImageClassificationDataset(BaseDataset):
         """New method"""
         logger.info("Now Create Zero Shot Image Classification Dataset.")
         cls.init_dataset_config(dataset_config)
-        rank_id = int(os.getenv("RANK_ID", "0"))
-        device_num = int(os.getenv("RANK_SIZE", "1"))
+        rank_id = RANK_ID
+        device_num = RANK_SIZE
 
         dataset = build_dataset_loader(
             dataset_config.data_loader, default_args={'num_shards': device_num, 'shard_id': rank_id})
@@ -910,3 +910,47 @@ class MindFormerBook:
     def get_model_ckpt_url_list(cls):
         """get_model_ckpt_url_list function"""
         return cls._MODEL_CKPT_URL_LIST
+
+
+class _SupportLists:
+    """The support lists of MindFormerBook, each list is only queried on its first access."""
+
+    def __init__(self):
+        self._book = None
+        self._lists = {}
+
+    def _get(self, getter_name):
+        """Query the list by the getter of MindFormerBook once."""
+        if getter_name not in self._lists:
+            if self._book is None:
+                self._book = MindFormerBook()
+            self._lists[getter_name] = getattr(self._book, getter_name)()
+        return self._lists[getter_name]
+
+    @property
+    def tasks(self):
+        """The support tasks of the trainer."""
+        return self._get('get_trainer_support_task_list')
+
+    @property
+    def model_names(self):
+        """The support model names."""
+        return self._get('get_model_name_support_list')
+
+    @property
+    def pipelines(self):
+        """The support tasks of the pipeline."""
+        return self._get('get_pipeline_support_task_list')
+
+    @property
+    def pipeline_input_data(self):
+        """The support input data of the pipeline."""
+        return self._get('get_pipeline_support_input_data_list')
+
+    @property
+    def project_path(self):
+        """The project path of mindformers."""
+        return self._get('get_project_path')
+
+
+SUPPORT_LISTS = _SupportLists()
@@ -27,7 +27,7 @@ from .base_tokenizer import *
 from .base_config import BaseConfig
 from .base_model import BaseModel
 from .base_processor import BaseProcessor, BaseImageProcessor, BaseAudioProcessor
-from .build_tokenizer import build_tokenizer
+from .build_tokenizer import build_tokenizer, build_cached_tokenizer
 from .build_processor import build_processor
 from .build_model import build_model_config, build_head, \
     build_model, build_encoder
@@ -22,6 +22,13 @@ import shutil
 
 import yaml
 
+# use the libyaml C bindings when they are available, which are much faster than the pure python ones,
+# the full loader and dumper are kept since the yaml files saved by the processors may have python tags
+try:
+    from yaml import CLoader as Loader, CDumper as Dumper
+except ImportError:
+    from yaml import Loader, Dumper
+
 from ..mindformer_book import MindFormerBook
 from ..mindformer_book import print_path_or_list
 from ..tools import logger
@@ -63,15 +70,13 @@ class BaseConfig(dict):
         self.update(kwargs)
 
     def __getattr__(self, key):
-        if key not in self:
-            return None
-        return self[key]
+        return dict.get(self, key)
 
     def __setattr__(self, key, value):
-        self[key] = value
+        dict.__setitem__(self, key, value)
 
     def __delattr__(self, key):
-        del self[key]
+        dict.__delitem__(self, key)
 
     def to_dict(self):
         """
@@ -129,25 +134,22 @@ class BaseConfig(dict):
                 # the relevant file will be downloaded from the Xihe platform.
                 # such as "mindspore/vit_base_p16"
                 yaml_name = yaml_name_or_path.split('/')[cls._model_name]
-                checkpoint_path = os.path.join(MindFormerBook.get_xihe_checkpoint_download_folder(),
-                                               yaml_name.split('_')[cls._model_type])
+                download_folder = MindFormerBook.get_xihe_checkpoint_download_folder()
             else:
                 # Default the name of yaml,
                 # the relevant file will be downloaded from the Obs platform.
                 # such as "vit_base_p16"
-                checkpoint_path = os.path.join(MindFormerBook.get_default_checkpoint_download_folder(),
-                                               yaml_name_or_path.split('_')[cls._model_type])
-
-            if not os.path.exists(checkpoint_path):
-                os.makedirs(checkpoint_path)
+                download_folder = MindFormerBook.get_default_checkpoint_download_folder()
+            model_type = yaml_name.split('_')[cls._model_type]
+            checkpoint_path = os.path.join(download_folder, model_type)
+            os.makedirs(checkpoint_path, exist_ok=True)
 
             yaml_file = os.path.join(checkpoint_path, yaml_name + ".yaml")
             if not os.path.exists(yaml_file):
                 default_yaml_file = os.path.join(
                     MindFormerBook.get_project_path(),
-                    "configs", yaml_name.split("_")[cls._model_type],
-                    "model_config", yaml_name + ".yaml")
-                if os.path.realpath(default_yaml_file) and os.path.exists(default_yaml_file):
+                    "configs", model_type, "model_config", yaml_name + ".yaml")
+                if os.path.exists(default_yaml_file):
                     shutil.copy(default_yaml_file, yaml_file)
                     logger.info("default yaml config in %s is used.", yaml_file)
                 else:
@@ -158,7 +160,7 @@ class BaseConfig(dict):
         MindFormerBook.set_model_config_to_name(id(config), config_args.model.arch.type)
         return config
 
-    def save_pretrained(self, save_directory=None, save_name="mindspore_model"):
+    def save_pretrained(self, save_directory=None, save_name="mindspore_model", merge=True):
         """
         Save_pretrained.
 
@@ -166,6 +168,9 @@ class BaseConfig(dict):
             save_directory (str): a directory to save config yaml
 
             save_name (str): the name of save files.
+
+            merge (bool): whether to merge the config into the content of the existing yaml file,
+                if False, the existing file is overwritten without being read. Default: True.
         """
         if save_directory is None:
             save_directory = MindFormerBook.get_default_checkpoint_save_folder()
@@ -179,22 +184,21 @@ class BaseConfig(dict):
 
         save_path = os.path.join(save_directory, save_name + ".yaml")
 
-        parsed_config, removed_list = self._inverse_parse_config()
-        wraped_config = self._wrap_config(parsed_config)
-        for key, val in removed_list:
-            self[key] = val
-        self.remove_type()
+        model_name = self.get("model_name")
+        if model_name is None:
+            model_name = MindFormerBook.get_model_config_to_name().get(id(self), None)
+        model_config = self._to_serializable()
+        model_config.pop("model_name", None)
+        wraped_config = {"model": {"model_config": model_config, "arch": {"type": model_name}}}
 
         meraged_dict = {}
-        if os.path.exists(save_path):
+        if merge and os.path.isfile(save_path) and os.path.getsize(save_path) > 0:
             with open(save_path, 'r') as file_reader:
-                meraged_dict = yaml.load(file_reader.read(), Loader=yaml.Loader)
-            file_reader.close()
+                meraged_dict = yaml.load(file_reader, Loader=Loader) or {}
         meraged_dict.update(wraped_config)
 
         with open(save_path, 'w') as file_pointer:
-            file_pointer.write(yaml.dump(meraged_dict))
-        file_pointer.close()
+            yaml.dump(meraged_dict, file_pointer, Dumper=Dumper, sort_keys=False)
         logger.info("config saved successfully!")
 
     def remove_type(self):
@@ -234,21 +238,21 @@ class BaseConfig(dict):
             self.pop(key)
         return self, removed_list
 
-    def _wrap_config(self, config):
+    def _to_serializable(self):
         """
-        Wrap config function, which wraps a config to rebuild content of yaml file.
-
-        Args:
-            config (BaseConfig): a config processed by _inverse_parse_config function.
+        Build the yaml content of the model config in a single traversal,
+        the config itself is not modified.
 
         Returns:
-            A (config) dict for yaml.dump.
+            A dict which contains the type of the config and its serializable values.
         """
-        model_name = self.pop("model_name", None)
-        if model_name is None:
-            model_name = MindFormerBook.get_model_config_to_name().get(id(config), None)
-
-        return {"model": {"model_config": config.to_dict(), "arch": {"type": model_name}}}
+        serializable = {"type": self.__class__.__name__}
+        for key, val in self.items():
+            if isinstance(val, BaseConfig):
+                serializable[key] = val._to_serializable()  # pylint: disable=W0212
+            elif isinstance(val, (str, int, float, bool)):
+                serializable[key] = val
+        return serializable
 
     @classmethod
     def show_support_list(cls):
@@ -14,6 +14,11 @@
 # ============================================================================
 
 """Build Tokenizer API."""
+import copy
+import json
+from functools import lru_cache
+from typing import Union
+
 from mindformers.tools.register import MindFormerRegister, MindFormerModuleType
 from ..mindformer_book import MindFormerBook
 
@@ -73,3 +78,42 @@ def build_tokenizer(
             config, MindFormerModuleType.TOKENIZER, default_args=default_args)
 
     return MindFormerRegister.get_instance(module_type, class_name, **kwargs)
+
+
+@lru_cache(maxsize=8)
+def _build_tokenizer_from_json(config_json):
+    """Build the tokenizer from the json string of its config or its name, the result is cached.
+    The config completed with the vocab files by the build is also returned, None for the name."""
+    config = json.loads(config_json)
+    if isinstance(config, str):
+        # imported here as the auto_class module imports the models package
+        from ..auto_class import AutoTokenizer
+        return AutoTokenizer.from_pretrained(config), None
+    return build_tokenizer(config), config
+
+
+def build_cached_tokenizer(config: Union[dict, str] = None):
+    r"""Build tokenizer For MindFormer, reusing the loaded vocab among the identical tokenizer configs.
+    It avoids reloading the vocab files when the trainers, pipelines and datasets are rebuilt with the same
+    tokenizer config. Each call returns a shallow copy of the cached tokenizer, so setting its attributes,
+    such as padding_side, does not change the tokenizers of the other callers, while the vocab is shared.
+    As build_tokenizer, the vocab files found by the build are written back into the config.
+
+    Args:
+        config (Union[dict, str]): The task tokenizer's config, or the name or the directory of the
+            pretrained tokenizer which is loaded by AutoTokenizer. Default: None.
+
+    Return:
+        The function instance of tokenizer API.
+    """
+    try:
+        config_json = json.dumps(config, sort_keys=True)
+    except TypeError:
+        # the config contains values which can not be the cache key, such as the tokenizer instance
+        return build_tokenizer(config)
+    tokenizer, built_config = _build_tokenizer_from_json(config_json)
+    if built_config is not None:
+        for key, value in built_config.items():
+            if key not in config:
+                config[key] = value
+    return copy.copy(tokenizer)
@@ -13,9 +13,12 @@
 # limitations under the License.
 # ============================================================================
 """Check Model Input Config."""
+from functools import lru_cache
+
 import mindspore.common.dtype as mstype
 
 
+@lru_cache(maxsize=16)
 def convert_mstype(ms_type: str = "float16"):
     """Convert the string type to MindSpore type."""
     if ms_type == "float16":
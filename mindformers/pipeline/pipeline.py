@@ -18,15 +18,12 @@ pipeline
 """
 from typing import Optional, Union
 
-from mindformers.models import build_model, build_tokenizer, build_processor, \
+from mindformers.models import build_model, build_cached_tokenizer, build_processor, \
     BaseModel, BaseTokenizer, BaseImageProcessor, BaseAudioProcessor
-from mindformers.mindformer_book import MindFormerBook
+from mindformers.mindformer_book import SUPPORT_LISTS
 from mindformers.tools.register import MindFormerConfig
 from .build_pipeline import build_pipeline
 
-SUPPORT_PIPELINES = MindFormerBook().get_pipeline_support_task_list()
-SUPPORT_MODEL_NAMES = MindFormerBook().get_model_name_support_list()
-
 
 def pipeline(
         task: str = None,
@@ -65,20 +62,20 @@ def pipeline(
             {'score': 6.75336e-06, 'label': 'tree'},
             {'score': 2.396818e-06, 'label': 'cat'}]]
     """
-    if task not in SUPPORT_PIPELINES.keys():
+    if task not in SUPPORT_LISTS.pipelines.keys():
         raise KeyError(f"{task} is not supported by pipeline. please select"
-                       f" a task from {SUPPORT_PIPELINES.keys()}.")
+                       f" a task from {SUPPORT_LISTS.pipelines.keys()}.")
 
     if isinstance(model, str):
-        if model not in SUPPORT_MODEL_NAMES:
+        if model not in SUPPORT_LISTS.model_names:
             raise KeyError(
-                f"model must be in {SUPPORT_MODEL_NAMES} when model's type is string, but get {model}.")
+                f"model must be in {SUPPORT_LISTS.model_names} when model's type is string, but get {model}.")
         model_name = model
         model = None
     else:
         model_name = "common"
 
-    pipeline_config = MindFormerConfig(SUPPORT_PIPELINES.get(task).get(model_name))
+    pipeline_config = MindFormerConfig(SUPPORT_LISTS.pipelines.get(task).get(model_name))
 
     if model is None:
         model = build_model(pipeline_config.model)
@@ -90,7 +87,7 @@ def pipeline(
         audio_processor = build_processor(pipeline_config.processor.audio_processor)
 
     if tokenizer is None:
-        tokenizer = build_tokenizer(pipeline_config.processor.tokenizer)
+        tokenizer = build_cached_tokenizer(pipeline_config.processor.tokenizer)
 
     task_pipeline = build_pipeline(class_name=task,
                                    model=model,
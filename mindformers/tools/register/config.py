@@ -20,6 +20,11 @@ from argparse import Action
 from collections import OrderedDict
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 BASE_CONFIG = 'base_config'
 
 
@@ -311,9 +316,9 @@ def ordered_yaml_load(stream, yaml_loader=yaml.SafeLoader,
     return yaml.load(stream, OrderedLoader)
 
 
-def ordered_yaml_dump(data, stream=None, yaml_dumper=yaml.SafeDumper,
+def ordered_yaml_dump(data, stream=None, yaml_dumper=SafeDumper,
                       object_pairs_hook=OrderedDict, **kwargs):
-    """Dump Dict to Yaml File in Orderedly."""
+    """Dump Dict to Yaml File in Orderedly, the C emitter of libyaml is used by default when it is available."""
     class OrderedDumper(yaml_dumper):
         pass
 
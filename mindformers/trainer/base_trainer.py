@@ -14,7 +14,6 @@
 # ============================================================================
 """Base Trainer."""
 import os
-import shutil
 from typing import Optional, Union, List
 
 import mindspore as ms
@@ -25,27 +24,24 @@ from mindspore.nn.wrap.cell_wrapper import _VirtualDatasetCell
 from mindspore.nn import TrainOneStepCell, Optimizer, Cell, \
     PipelineCell, MicroBatchInterleaved
 
-from mindformers.mindformer_book import MindFormerBook
+from mindformers.mindformer_book import SUPPORT_LISTS
 from mindformers.core import build_lr, build_optim, build_callback, build_metric
 from mindformers.core.parallel_config import build_parallel_config
 from mindformers.dataset import build_dataset, check_dataset_config, BaseDataset
-from mindformers.models import build_model, build_processor, build_tokenizer, BaseModel
+from mindformers.dataset.base_dataset import RANK_ID
+from mindformers.models import build_model, build_processor, build_tokenizer, build_cached_tokenizer, BaseModel
 from mindformers.wrapper import build_wrapper
 from mindformers.tools.register import MindFormerConfig
 from mindformers.tools.logger import logger
 from mindformers.tools.utils import count_params
 from .config_args import ConfigArguments
 from .training_args import TrainingArguments
-from .utils import check_runner_config, resume_checkpoint_for_training
+from .utils import check_runner_config, resume_checkpoint_for_training, prefetch_checkpoint_for_training, \
+    copy_configs_directory
 from .optimizer_grouped_parameters import get_optimizer_grouped_parameters
 from .utils import set_seed, check_train_data_loader_type, \
     check_eval_data_loader_type, check_optimizer_and_lr_type, check_wrapper_config
 
-SUPPORT_TASKS = MindFormerBook().get_trainer_support_task_list()
-SUPPORT_MODEL_NAMES = MindFormerBook().get_model_name_support_list()
-SUPPORT_PIPELINES = MindFormerBook().get_pipeline_support_task_list()
-SUPPORT_PIPELINE_INPUT_DATA = MindFormerBook().get_pipeline_support_input_data_list()
-CURRENT_PROJECT_PATH = MindFormerBook().get_project_path()
 DEFAULT_CONFIG_DIR = 'configs'
 
 
@@ -84,20 +80,22 @@ class BaseTrainer:
         self.compute_metrics = None
         self.kwargs = None
 
-        if not os.path.exists(os.path.join('.', DEFAULT_CONFIG_DIR)):
+        # only rank 0 copies the configs, the other ranks do not read the copied yaml files,
+        # the yaml files they save into ./configs meanwhile are kept by the copy
+        if RANK_ID == 0 and not os.path.exists(os.path.join('.', DEFAULT_CONFIG_DIR)):
             configs_directory = os.path.join('.', DEFAULT_CONFIG_DIR)
-            if os.path.exists(os.path.join(CURRENT_PROJECT_PATH, DEFAULT_CONFIG_DIR)):
-                mindformers_configs_directory = os.path.join(CURRENT_PROJECT_PATH, DEFAULT_CONFIG_DIR)
-                shutil.copytree(mindformers_configs_directory, configs_directory)
+            if os.path.exists(os.path.join(SUPPORT_LISTS.project_path, DEFAULT_CONFIG_DIR)):
+                mindformers_configs_directory = os.path.join(SUPPORT_LISTS.project_path, DEFAULT_CONFIG_DIR)
+                copy_configs_directory(mindformers_configs_directory, configs_directory)
 
-        if task not in SUPPORT_TASKS.keys():
+        if task not in SUPPORT_LISTS.tasks.keys():
             logger.warning("Input task name is not in the supported list or unspecified.")
 
-        if task in SUPPORT_TASKS.keys() and model_name not in SUPPORT_TASKS.get(task).keys():
+        if task in SUPPORT_LISTS.tasks.keys() and model_name not in SUPPORT_LISTS.tasks.get(task).keys():
             logger.warning("Input model name is not in the supported list or unspecified.")
-            logger.warning("See the list of supported task and model name: %s", SUPPORT_TASKS)
+            logger.warning("See the list of supported task and model name: %s", SUPPORT_LISTS.tasks)
             logger.warning("The default model config: %s will now be used for the %s task ",
-                           SUPPORT_TASKS.get(self.task).get("common"), task)
+                           SUPPORT_LISTS.tasks.get(self.task).get("common"), task)
             self.model_name = "common"
 
     def set_config(self,
@@ -126,8 +124,8 @@ class BaseTrainer:
     def setup_task_config(self):
         """Setup the default task config."""
         task_config = None
-        if self.task in SUPPORT_TASKS.keys() and self.model_name in SUPPORT_TASKS.get(self.task).keys():
-            task_config = MindFormerConfig(SUPPORT_TASKS.get(self.task).get(self.model_name))
+        if self.task in SUPPORT_LISTS.tasks.keys() and self.model_name in SUPPORT_LISTS.tasks.get(self.task).keys():
+            task_config = MindFormerConfig(SUPPORT_LISTS.tasks.get(self.task).get(self.model_name))
 
         if isinstance(task_config, MindFormerConfig):
             self.default_task_config = task_config
@@ -265,8 +263,13 @@ class BaseTrainer:
     def create_tokenizer(self, default_args: dict = None):
         """Create the tokenizer for task trainer."""
         logger.info(".........Build Text Tokenizer From Config..........")
-        self.tokenizer = build_tokenizer(
-            self.config.processor.tokenizer, default_args=default_args)
+        if default_args is None:
+            # the trainers built with the same tokenizer config get copies of one cached tokenizer,
+            # which share the vocab, the vocab files found by the build are written back to the config
+            self.tokenizer = build_cached_tokenizer(self.config.processor.tokenizer)
+        else:
+            self.tokenizer = build_tokenizer(
+                self.config.processor.tokenizer, default_args=default_args)
         return self.tokenizer
 
     def create_optimizer_scheduler(self, network, layer_scale=False):
@@ -457,6 +460,9 @@ class BaseTrainer:
         is_full_config = kwargs.get("is_full_config", False)
         config = self.set_config(config, is_full_config)
 
+        # read the resume checkpoint while building the dataset, network and optimizer
+        checkpoint_future = prefetch_checkpoint_for_training(config)
+
         # build dataset
         logger.info(".........Build Dataset For Train..........")
         if dataset is None:
@@ -498,7 +504,7 @@ class BaseTrainer:
         # resume checkpoint
         if config.resume_or_finetune_checkpoint:
             logger.info(".............Start resume training from checkpoint..................")
-            resume_checkpoint_for_training(config, network, optimizer)
+            resume_checkpoint_for_training(config, network, optimizer, checkpoint_future)
 
         # build model wrapper
         if wrapper is None:
@@ -21,7 +21,7 @@ from mindspore.nn import TrainOneStepCell, Optimizer, Cell
 from mindspore.dataset import GeneratorDataset
 
 from mindformers.dataset import BaseDataset
-from mindformers.models import build_model, BaseModel, BaseTokenizer, build_tokenizer
+from mindformers.models import build_model, BaseModel, BaseTokenizer, build_cached_tokenizer
 from mindformers.tools.logger import logger
 from mindformers.tools.utils import count_params
 from mindformers.pipeline import pipeline
@@ -136,7 +136,7 @@ class CausalLanguageModelingTrainer(BaseTrainer):
         logger.info(".........Build Net..........")
 
         if tokenizer is None:
-            tokenizer = build_tokenizer(config.processor.tokenizer)
+            tokenizer = build_cached_tokenizer(config.processor.tokenizer)
 
         if network is None:
             network = build_model(config.model)
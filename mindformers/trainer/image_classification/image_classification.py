@@ -13,6 +13,9 @@
 # limitations under the License.
 # ============================================================================
 """Image Classification Trainer."""
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Union
 
 import numpy as np
@@ -94,6 +97,10 @@ class ImageClassificationTrainer(BaseTrainer):
 
     def __init__(self, model_name: str = None):
         super().__init__('image_classification', model_name)
+        # only the last used pipeline is kept, so the replaced networks are not held by the trainer
+        self._pipeline_cache = (None, None)
+        self._param_count_cache = weakref.WeakKeyDictionary()
+        self._predict_config = None
 
     def train(self,
               config: Optional[Union[dict, MindFormerConfig, ConfigArguments, TrainingArguments]] = None,
@@ -207,7 +214,18 @@ class ImageClassificationTrainer(BaseTrainer):
                 It support BaseImageProcessor class.
                 Default: None.
         """
-        config = self.set_config(config)
+        # the default config is resolved by the first predict and reused by the later ones,
+        # as long as self.config is not replaced by another call meanwhile
+        is_default_config = config is None
+        if is_default_config and self._predict_config is not None and self.config is self._predict_config:
+            config = self._predict_config
+        else:
+            config = self.set_config(config)
+            if is_default_config:
+                # the cached pipeline may hold the network built from the replaced config
+                self._predict_config = config
+                self._pipeline_cache = (None, None)
+        num_io_workers = kwargs.pop("num_io_workers", None)
 
         logger.info(".........Build Input Data For Predict..........")
         if input_data is None:
@@ -215,28 +233,122 @@ class ImageClassificationTrainer(BaseTrainer):
         if not isinstance(input_data, (Tensor, np.ndarray, Image, str, list)):
             raise ValueError("Input data's type must be one of "
                              "[str, ms.Tensor, np.ndarray, PIL.Image.Image, list]")
-        batch_input_data = []
-        if isinstance(input_data, str):
-            batch_input_data.append(load_image(input_data))
-        elif isinstance(input_data, list):
-            for data_path in input_data:
-                batch_input_data.append(load_image(data_path))
-        else:
-            batch_input_data = input_data
+        load_input = _PREDICT_INPUT_LOADERS.get(type(input_data), _batch_single_input)
+        batch_input_data = load_input(input_data, num_io_workers)
 
-        logger.info(".........Build Net For Predict..........")
-        if network is None:
-            network = self.create_network()
-        logger.info("Network Parameters: %s M.", str(count_params(network)))
+        # the pipeline is reused by the later calls with the same arguments, which keeps the compiled network,
+        # the network or image processor built from a custom config is not cached since the config may change
+        pipeline_key = None
+        if is_default_config or (network is not None and image_processor is not None):
+            pipeline_key = _pipeline_cache_key(network, image_processor, kwargs)
+        cached_key, pipeline_task = self._pipeline_cache
+        if pipeline_key is None or pipeline_key != cached_key:
+            logger.info(".........Build Net For Predict..........")
+            if network is None:
+                network = self.create_network()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Network Parameters: %s M.", str(self._count_params(network)))
 
-        logger.info(".........Build Image Processor For Predict..........")
-        if image_processor is None:
-            image_processor = self.create_image_processor()
+            logger.info(".........Build Image Processor For Predict..........")
+            if image_processor is None:
+                image_processor = self.create_image_processor()
 
-        pipeline_task = pipeline(task='image_classification',
-                                 model=network,
-                                 image_processor=image_processor, **kwargs)
-        output_result = pipeline_task(batch_input_data)
+            pipeline_task = pipeline(task='image_classification',
+                                     model=network,
+                                     image_processor=image_processor, **kwargs)
+            if pipeline_key is not None:
+                self._pipeline_cache = (pipeline_key, pipeline_task)
+        batch_size = config.runner_config.batch_size if config.runner_config else None
+        output_result = _predict_in_batches(pipeline_task, batch_input_data, batch_size)
         logger.info("output result is: %s", str(output_result))
         logger.info(".........Predict Over!.............")
         return output_result
+
+    def _count_params(self, network):
+        """Count the parameters of the network once, the count is dropped with the network."""
+        param_count = self._param_count_cache.get(network)
+        if param_count is None:
+            param_count = count_params(network)
+            self._param_count_cache[network] = param_count
+        return param_count
+
+
+def _pipeline_cache_key(network, image_processor, kwargs):
+    """The key of the cached pipeline, None if the kwargs are unhashable."""
+    try:
+        key = (id(network), id(image_processor), tuple(sorted(kwargs.items())))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _load_rgb_image(data_path):
+    """Load the image as an RGB uint8 array, so the conversion is also done in the loading threads."""
+    image = load_image(data_path)
+    if isinstance(image, Tensor):
+        return image
+    return np.asarray(image, dtype=np.uint8)
+
+
+def _load_images(data_paths, num_io_workers=None):
+    """Load the images in the threads, since the reading and decoding release the GIL, the order is kept."""
+    if num_io_workers is None:
+        num_io_workers = min(32, len(data_paths))
+    if num_io_workers <= 1:
+        return [_load_rgb_image(data_path) for data_path in data_paths]
+    with ThreadPoolExecutor(max_workers=num_io_workers) as executor:
+        return list(executor.map(_load_rgb_image, data_paths))
+
+
+def _stack_images(images):
+    """Stack the image arrays of the same shape into one (N, H, W, C) array, otherwise keep the list."""
+    if images and all(isinstance(image, np.ndarray) for image in images) \
+            and len({image.shape for image in images}) == 1:
+        return np.stack(images, axis=0)
+    return images
+
+
+def _predict_in_batches(pipeline_task, batch_input_data, batch_size=None):
+    """
+    Run the stacked images through the pipeline in chunks of batch_size, so the forward pass is bounded.
+    The last chunk is padded with copies of the last image, so every chunk has the same shape,
+    the results of the padding images are dropped.
+    """
+    if not isinstance(batch_input_data, np.ndarray) or not batch_size or len(batch_input_data) <= batch_size:
+        return pipeline_task(batch_input_data)
+    num_images = len(batch_input_data)
+    num_padding = -num_images % batch_size
+    if num_padding:
+        padding = np.repeat(batch_input_data[-1:], num_padding, axis=0)
+        batch_input_data = np.concatenate((batch_input_data, padding), axis=0)
+    output_result = []
+    for start in range(0, len(batch_input_data), batch_size):
+        output_result.extend(pipeline_task(batch_input_data[start:start + batch_size]))
+    return output_result[:num_images]
+
+
+def _load_single_image(data_path, num_io_workers=None):  # pylint: disable=W0613
+    """Load a single image into a batch of one image, converted the same way as the images of a list."""
+    return [_load_rgb_image(data_path)]
+
+
+def _load_batch_images(data_paths, num_io_workers=None):
+    """Load a list of images into the stacked batch, only the list of paths is read in the threads."""
+    if all(isinstance(data_path, str) for data_path in data_paths):
+        return _stack_images(_load_images(data_paths, num_io_workers))
+
+    # the decoded arrays are passed through, the other images are only converted
+    return _stack_images([image if isinstance(image, np.ndarray) else _load_rgb_image(image) for image in data_paths])
+
+
+def _batch_single_input(input_data, num_io_workers=None):  # pylint: disable=W0613
+    """Give the decoded input an explicit batch dim, the 4-rank arrays and tensors are already batched."""
+    if isinstance(input_data, (np.ndarray, Tensor)):
+        if input_data.ndim != 3:
+            return input_data
+        return np.expand_dims(input_data, 0) if isinstance(input_data, np.ndarray) else input_data.expand_dims(0)
+    return [input_data]
+
+
+_PREDICT_INPUT_LOADERS = {str: _load_single_image, list: _load_batch_images}
@@ -25,7 +25,7 @@ from mindspore.dataset import GeneratorDataset
 
 
 from mindformers.dataset import BaseDataset
-from mindformers.models import build_model, build_tokenizer, build_processor, \
+from mindformers.models import build_model, build_cached_tokenizer, build_processor, \
     BaseModel, BaseTokenizer, BaseImageProcessor
 from mindformers.pipeline import pipeline
 from mindformers.tools.logger import logger
@@ -149,7 +149,7 @@ class ZeroShotImageClassificationTrainer(BaseTrainer):
             logger.info("Network Parameters: %s M.", str(count_params(network)))
 
         if tokenizer is None:
-            tokenizer = build_tokenizer(config.processor.tokenizer)
+            tokenizer = build_cached_tokenizer(config.processor.tokenizer)
 
         if image_processor is None:
             image_processor = build_processor(config.processor.image_processor)
@@ -21,7 +21,7 @@ from mindspore.dataset import GeneratorDataset
 
 from mindformers.dataset import BaseDataset
 from mindformers.models import build_model, BaseModel, \
-    BaseTokenizer, build_tokenizer
+    BaseTokenizer, build_cached_tokenizer
 
 from mindformers.tools.logger import logger
 from mindformers.tools.utils import count_params
@@ -152,7 +152,7 @@ class MaskedLanguageModelingTrainer(BaseTrainer):
                              f"[str, list], but got type {type(input_data)}")
 
         if tokenizer is None:
-            tokenizer = build_tokenizer(config.processor.tokenizer)
+            tokenizer = build_cached_tokenizer(config.processor.tokenizer)
 
         logger.info(".........Build Net..........")
         if network is None:
@@ -44,13 +44,14 @@ def get_optimizer_grouped_parameters(model: Optional[BaseModel] = None,
         skip_keywords = model.no_weight_decay_keywords()
         logger.info('No weight decay keywords: %s', skip_keywords)
 
-    decay_parameters_names = [
-        param.name for param in model.trainable_params()
+    trainable_params = model.trainable_params()
+    decay_parameters_names = {
+        param.name for param in trainable_params
         if not (len(param.shape) == 1
                 or param.name.endswith(".bias")
                 or (param.name in skip_params)
                 or check_keywords_in_name(param.name, skip_keywords))
-    ]
+    }
 
     get_layer_id_func = None
     scales_list = []
@@ -77,7 +78,7 @@ def get_optimizer_grouped_parameters(model: Optional[BaseModel] = None,
     parameter_group_names = {}
     parameter_group_vars = {}
     scale = 1.
-    for param in model.trainable_params():
+    for param in trainable_params:
         if param.name in decay_parameters_names:
             group_name = 'decay'
         else:
@@ -21,7 +21,7 @@ from mindspore.dataset import GeneratorDataset
 from mindspore.nn import TrainOneStepCell, Optimizer, Cell
 
 from mindformers.dataset import BaseDataset
-from mindformers.models import build_model, build_tokenizer, \
+from mindformers.models import build_model, build_cached_tokenizer, \
     BaseModel, BaseTokenizer
 from mindformers.tools.logger import logger
 from mindformers.tools.utils import count_params
@@ -189,7 +189,7 @@ class QuestionAnsweringTrainer(BaseTrainer):
         config.model.model_config.batch_size = 1
 
         if tokenizer is None:
-            tokenizer = build_tokenizer(config.processor.tokenizer)
+            tokenizer = build_cached_tokenizer(config.processor.tokenizer)
 
         logger.info(".........Build Net..........")
         if network is None:
@@ -19,7 +19,7 @@ from mindspore.dataset import GeneratorDataset
 from mindspore.nn import TrainOneStepCell, Optimizer, Cell
 
 from mindformers.dataset import BaseDataset
-from mindformers.models import build_model, build_tokenizer, \
+from mindformers.models import build_model, build_cached_tokenizer, \
     BaseModel, BaseTokenizer
 from mindformers.tools.logger import logger
 from mindformers.tools.utils import count_params
@@ -192,7 +192,7 @@ class TokenClassificationTrainer(BaseTrainer):
         config.model.model_config.batch_size = 1
 
         if tokenizer is None:
-            tokenizer = build_tokenizer(config.processor.tokenizer)
+            tokenizer = build_cached_tokenizer(config.processor.tokenizer)
 
         id2label = {label_id: label for label_id, label in enumerate(cluener_labels)}
 
@@ -13,10 +13,13 @@
 # limitations under the License.
 # ============================================================================
 """Trainer API For Import."""
+import copy
+import logging
 import os
-import shutil
 from collections import OrderedDict
-from pprint import pprint
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pprint import pformat
 from typing import List, Optional, Union
 
 import numpy as np
@@ -33,7 +36,8 @@ from mindspore.dataset.engine.datasets import BatchDataset, RepeatDataset
 from mindformers.core.parallel_config import build_parallel_config
 from mindformers.dataset import build_dataset, build_dataset_loader, \
     check_dataset_config, BaseDataset
-from mindformers.mindformer_book import MindFormerBook
+from mindformers.dataset.base_dataset import RANK_ID
+from mindformers.mindformer_book import SUPPORT_LISTS
 from mindformers.models import build_model, BaseModel, BaseImageProcessor, \
     BaseTokenizer, BaseAudioProcessor
 from mindformers.tools.cloud_adapter import CFTS
@@ -44,17 +48,31 @@ from .build_trainer import build_trainer
 from .config_args import ConfigArguments
 from .training_args import TrainingArguments
 from .utils import check_train_data_loader_type, check_eval_data_loader_type, \
-    check_optimizer_and_lr_type, check_wrapper_config, config2dict
+    check_optimizer_and_lr_type, check_wrapper_config, config2dict, copy_configs_directory
 
 __all__ = ['Trainer']
 
-SUPPORT_TASKS = MindFormerBook().get_trainer_support_task_list()
-SUPPORT_MODEL_NAMES = MindFormerBook().get_model_name_support_list()
-SUPPORT_PIPELINES = MindFormerBook().get_pipeline_support_task_list()
-SUPPORT_PIPELINE_INPUT_DATA = MindFormerBook().get_pipeline_support_input_data_list()
-CURRENT_PROJECT_PATH = MindFormerBook().get_project_path()
 DEFAULT_CHECKPOINT_DIR = 'checkpoint'
 DEFAULT_CONFIG_DIR = 'configs'
+# the yaml file which each key of the config is saved to, in the saving order
+_SAVE_CONFIG_ROUTE = (
+    ('model', 'model_config'),
+    ('processor', 'model_config'),
+    ('train_dataset', 'dataset_config'),
+    ('train_dataset_task', 'dataset_config'),
+    ('eval_dataset', 'dataset_config'),
+    ('eval_dataset_task', 'dataset_config'),
+    ('context', 'context_config'),
+    ('parallel', 'context_config'),
+    ('moe_config', 'context_config'),
+    ('recompute_config', 'context_config'),
+    ('parallel_config', 'context_config'),
+    ('runner_config', 'runner_config'),
+    ('runner_wrapper', 'runner_config'),
+    ('optimizer', 'runner_config'),
+    ('lr_schedule', 'runner_config'),
+    ('callbacks', 'runner_config'),
+)
 
 
 class Trainer:
@@ -194,11 +212,12 @@ class Trainer:
         self.configs_directory = os.path.join('.', DEFAULT_CONFIG_DIR)
         self.kwargs = kwargs
 
-        if not os.path.exists(os.path.join('.', DEFAULT_CONFIG_DIR)):
-            configs_directory = os.path.join('.', DEFAULT_CONFIG_DIR)
-            if os.path.exists(os.path.join(CURRENT_PROJECT_PATH, DEFAULT_CONFIG_DIR)):
-                mindformers_configs_directory = os.path.join(CURRENT_PROJECT_PATH, DEFAULT_CONFIG_DIR)
-                shutil.copytree(mindformers_configs_directory, configs_directory)
+        # only rank 0 copies the configs, the other ranks do not read the copied yaml files,
+        # the yaml files they save into ./configs meanwhile are kept by the copy
+        if RANK_ID == 0 and not os.path.exists(self.configs_directory):
+            mindformers_configs_directory = os.path.join(SUPPORT_LISTS.project_path, DEFAULT_CONFIG_DIR)
+            if os.path.exists(mindformers_configs_directory):
+                copy_configs_directory(mindformers_configs_directory, self.configs_directory)
 
         if wrapper is not None:
             if model is not None:
@@ -208,11 +227,11 @@ class Trainer:
                 logger.warning(
                     'wrapper has existed, input optimizers invalid, it should be include in wrapper.')
 
-        assert task in SUPPORT_TASKS.keys(), \
-            f"task name must be in {SUPPORT_TASKS.keys()}, but get {task}."
+        assert task in SUPPORT_LISTS.tasks.keys(), \
+            f"task name must be in {SUPPORT_LISTS.tasks.keys()}, but get {task}."
         if isinstance(model, str):
-            assert model in SUPPORT_MODEL_NAMES, \
-                f"model must be in {SUPPORT_MODEL_NAMES} when model's type is string, but get {model}."
+            assert model in SUPPORT_LISTS.model_names, \
+                f"model must be in {SUPPORT_LISTS.model_names} when model's type is string, but get {model}."
             self.model_name = model
             self.model = None
         else:
@@ -225,7 +244,7 @@ class Trainer:
         else:
             self.is_model_instance = False
 
-        task_config = MindFormerConfig(SUPPORT_TASKS.get(self.task).get(self.model_name))
+        task_config = _load_task_config(self.task, self.model_name)
 
         if self.model_name == "common":
             if self.model is not None:
@@ -239,7 +258,7 @@ class Trainer:
             if isinstance(args, dict):
                 task_config.merge_from_dict(args)
             elif isinstance(args, str):
-                assert os.path.realpath(args) and os.path.exists(args), \
+                assert os.path.exists(args), \
                     f"config path must be exist, but get {args}."
                 assert args.endswith(('.yaml', '.yml')), \
                     f"config file must be end with .yaml or .yml, but get {args}"
@@ -269,7 +288,7 @@ class Trainer:
 
         if save_config:
             self.save_config_to_yaml(self.config)
-            logger.info("save running config success of %s_new.", task_config.trainer.model_name.lower())
+            logger.debug("save running config success of %s_new.", task_config.trainer.model_name.lower())
 
         # check dataset config
         if isinstance(train_dataset, str):
@@ -303,15 +322,15 @@ class Trainer:
         cfts = CFTS(**self.config.aicc_config)
         MindFormerRegister.register_cls(cfts, alias='cfts')
 
-        # set seed
+        # set seed, the set_seed of mindspore also seeds the global numpy random state which the datasets rely on
         set_seed(self.config.seed)
-        np.random.seed(self.config.seed)
 
         # set output directory
         os.environ.setdefault("LOCAL_DEFAULT_PATH", self.config.output_dir)
 
-        # pprint last config
-        pprint(self.config)
+        # log last config, the formatting is skipped when the debug log is disabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("the last config is:\n%s", pformat(self.config))
 
         # build task trainer
         self.trainer = build_trainer(self.config.trainer)
@@ -487,9 +506,9 @@ class Trainer:
             raise TypeError(f"predict_checkpoint must be one of [None, string, bool], "
                             f"but get {predict_checkpoint}")
 
-        if self.task not in SUPPORT_PIPELINES.keys():
+        if self.task not in SUPPORT_LISTS.pipelines.keys():
             raise NotImplementedError(f"The {self.task} not support predict, "
-                                      f"now this tasks {SUPPORT_PIPELINES.keys()} is support predict.")
+                                      f"now this tasks {SUPPORT_LISTS.pipelines.keys()} is support predict.")
 
         if predict_checkpoint is False:
             predict_checkpoint = None
@@ -654,15 +673,13 @@ class Trainer:
         output_folder = self.config.output_dir
         checkpoint_dir = os.path.join(
             output_folder, 'rank_{}'.format(self.rank_id), DEFAULT_CHECKPOINT_DIR)
-        output_checkpoint_path = [
-            checkpoint for checkpoint in os.listdir(checkpoint_dir)
-            if checkpoint.endswith('.ckpt')
-        ]
+        with os.scandir(checkpoint_dir) as entries:
+            output_checkpoint_path = [entry for entry in entries if entry.name.endswith('.ckpt')]
         if not output_checkpoint_path:
             return None
-        output_checkpoint_path = sorted(output_checkpoint_path,
-                                        key=lambda x: os.path.getmtime(os.path.join(checkpoint_dir, x)))
-        return os.path.join(checkpoint_dir, output_checkpoint_path[-1])
+        # the stat of each entry is cached, so every checkpoint is only stat once
+        last_checkpoint = max(output_checkpoint_path, key=lambda entry: entry.stat().st_mtime)
+        return os.path.join(checkpoint_dir, last_checkpoint.name)
 
     def save_config_to_yaml(self, config: dict = None):
         """save now config file to yaml file."""
@@ -672,16 +689,11 @@ class Trainer:
         config_dict = _reset_config_for_save(config, model_name)
         config_dir = os.path.join(
             self.configs_directory, model_name.lower() + '_new')
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir, exist_ok=True)
-
+        # makedirs also creates the config_dir, and does nothing for the existing directories
         model_config_dir = os.path.join(config_dir, 'model_config')
         task_config_dir = os.path.join(config_dir, 'task_config')
-        if not os.path.exists(model_config_dir):
-            os.makedirs(model_config_dir, exist_ok=True)
-
-        if not os.path.exists(task_config_dir):
-            os.makedirs(task_config_dir, exist_ok=True)
+        os.makedirs(model_config_dir, exist_ok=True)
+        os.makedirs(task_config_dir, exist_ok=True)
 
         model_config_yaml_path = os.path.join(
             model_config_dir, '{}.yaml'.format(model_name.lower()))
@@ -691,11 +703,14 @@ class Trainer:
         context_yaml_path = os.path.join(task_config_dir, 'context.yaml')
         run_yaml_path = os.path.join(config_dir, 'run_{}.yaml'.format(model_name.lower()))
 
-        _save_config_to_yaml(model_config_yaml_path, config_dict.get('model_config'))
-        _save_config_to_yaml(dataset_config_yaml_path, config_dict.get('dataset_config'))
-        _save_config_to_yaml(runner_yaml_path, config_dict.get('runner_config'))
-        _save_config_to_yaml(context_yaml_path, config_dict.get('context_config'))
-        _save_config_to_yaml(run_yaml_path, config_dict.get('run_config'))
+        save_configs = [(model_config_yaml_path, config_dict.get('model_config')),
+                        (dataset_config_yaml_path, config_dict.get('dataset_config')),
+                        (runner_yaml_path, config_dict.get('runner_config')),
+                        (context_yaml_path, config_dict.get('context_config')),
+                        (run_yaml_path, config_dict.get('run_config'))]
+        # the yaml files are independent, so they are written at the same time
+        with ThreadPoolExecutor(max_workers=len(save_configs)) as executor:
+            list(executor.map(lambda save_args: _save_config_to_yaml(*save_args), save_configs))
 
     def _load_model_checkpoint(self):
         """Load model checkpoint to network."""
@@ -704,7 +719,7 @@ class Trainer:
             logger.warning("checkpoint_name_or_path is None, not load input checkpoint.")
         elif isinstance(checkpoint_name_or_path, str):
             is_exist_path = os.path.exists(checkpoint_name_or_path)
-            is_checkpoint_name = checkpoint_name_or_path in SUPPORT_MODEL_NAMES
+            is_checkpoint_name = checkpoint_name_or_path in SUPPORT_LISTS.model_names
             if is_exist_path:
                 logger.info("now input valid checkpoint path, it will load to network.")
                 checkpoint_dict = load_checkpoint(checkpoint_name_or_path)
@@ -736,6 +751,28 @@ class Trainer:
                 self.config.model.model_config.checkpoint_name_or_path = self.default_checkpoint_name_or_path
 
 
+@lru_cache(maxsize=None)
+def _load_task_config_dict(task: str, model_name: str):
+    r"""Parse the default task config yaml of the task and the model into plain dicts, only once.
+
+    Args:
+        task (str): The task name.
+        model_name (str): The model name of the task.
+    """
+    return MindFormerConfig._file2dict(SUPPORT_LISTS.tasks.get(task).get(model_name))  # pylint: disable=W0212
+
+
+def _load_task_config(task: str, model_name: str):
+    r"""Build a new default task config of the task and the model from the cached yaml content,
+    so each trainer works on its own config.
+
+    Args:
+        task (str): The task name.
+        model_name (str): The model name of the task.
+    """
+    return MindFormerConfig(**copy.deepcopy(_load_task_config_dict(task, model_name)))
+
+
 def _save_config_to_yaml(save_file_path: str = None, save_config: dict = None):
     r"""Save Config to Yaml File.
 
@@ -745,13 +782,18 @@ def _save_config_to_yaml(save_file_path: str = None, save_config: dict = None):
     """
     if save_config is None:
         save_config = {}
-    with open(save_file_path, 'w', encoding='utf-8') as file_pointer:
-        file_pointer.write(
-            ordered_yaml_dump(
-                save_config,
-                default_flow_style=False,
-                allow_unicode=True,
-                sort_keys=False))
+    yaml_content = ordered_yaml_dump(
+        save_config,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False).encode('utf-8')
+    file_descriptor = os.open(save_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(yaml_content)
+        while view:
+            view = view[os.write(file_descriptor, view):]
+    finally:
+        os.close(file_descriptor)
 
 
 def _reset_config_for_save(config: dict = None, model_name: str = 'common'):
@@ -760,9 +802,7 @@ def _reset_config_for_save(config: dict = None, model_name: str = 'common'):
         config (dict): The task config. Default: None.
         model_name (str): The model name to save. Default: 'common'.
     """
-    if config is None:
-        config = {}
-    config = config.copy()
+    flat_config = config2dict(config) if config is not None else {}
 
     config_dict = {
         "model_config": OrderedDict(),
@@ -772,57 +812,11 @@ def _reset_config_for_save(config: dict = None, model_name: str = 'common'):
         "run_config": OrderedDict()
     }
 
-    if config.get('model') is not None:
-        model_config = config2dict(config.pop('model'))
-        config_dict["model_config"].setdefault('model', model_config)
-
-    if config.get('processor') is not None:
-        processor_config = config2dict(config.config.pop('processor'))
-        config_dict["model_config"].setdefault('processor', processor_config)
-
-    if config.get('train_dataset_task') is not None and config.get('train_dataset') is not None:
-        train_dataset_config = config2dict(config.pop('train_dataset'))
-        train_dataset_task_config = config2dict(config.pop('train_dataset_task'))
-        config_dict["dataset_config"].setdefault('train_dataset', train_dataset_config)
-        config_dict["dataset_config"].setdefault('train_dataset_task', train_dataset_task_config)
-
-    if config.get('eval_dataset_task') is not None and config.get('eval_dataset') is not None:
-        eval_dataset_config = config2dict(config.pop('eval_dataset'))
-        eval_dataset_task_config = config2dict(config.pop('eval_dataset_task'))
-        config_dict["dataset_config"].setdefault('train_dataset', eval_dataset_config)
-        config_dict["dataset_config"].setdefault('train_dataset_task', eval_dataset_task_config)
-
-    if config.get('context') is not None:
-        context_config = config2dict(config.pop('context'))
-        parallel_context_config = config2dict(config.pop('parallel'))
-        moe_conifg = config2dict(config.pop('moe_config'))
-        recompute_config = config2dict(config.pop('recompute_config'))
-        parallel_config = config2dict(config.pop('parallel_config'))
-        config_dict['context_config'].setdefault('context', context_config)
-        config_dict['context_config'].setdefault('parallel', parallel_context_config)
-        config_dict['context_config'].setdefault('moe_conifg', moe_conifg)
-        config_dict['context_config'].setdefault('recompute_config', recompute_config)
-        config_dict['context_config'].setdefault('parallel_config', parallel_config)
-
-    if config.get('runner_config') is not None:
-        runner_config = config2dict(config.pop('runner_config'))
-        config_dict['runner_config'].setdefault('runner_config', runner_config)
-
-    if config.get('runner_wrapper') is not None:
-        wrapper_config = config2dict(config.pop('runner_wrapper'))
-        config_dict['runner_config'].setdefault('runner_wrapper', wrapper_config)
-
-    if config.get('optimizer') is not None:
-        optim_config = config2dict(config.pop('optimizer'))
-        config_dict['runner_config'].setdefault('optimizer', optim_config)
-
-    if config.get('lr_schedule') is not None:
-        lr_config = config2dict(config.pop('lr_schedule'))
-        config_dict['runner_config'].setdefault('lr_schedule', lr_config)
-
-    if config.get('callbacks') is not None:
-        cb_config = config2dict(config.pop('callbacks'))
-        config_dict['runner_config'].setdefault('callbacks', cb_config)
+    routed_keys = set()
+    for key, config_name in _SAVE_CONFIG_ROUTE:
+        if flat_config.get(key) is not None:
+            config_dict[config_name].setdefault(key, flat_config[key])
+            routed_keys.add(key)
 
     config_dict['run_config'].setdefault('base_config', [
         './task_config/context.yaml',
@@ -830,8 +824,8 @@ def _reset_config_for_save(config: dict = None, model_name: str = 'common'):
         './task_config/{}_dataset.yaml'.format(model_name.lower()),
         './model_config/{}.yaml'.format(model_name.lower())])
 
-    run_config = config2dict(config)
-    for key, value in run_config.items():
-        config_dict['run_config'].setdefault(key, value)
+    for key, value in flat_config.items():
+        if key not in routed_keys:
+            config_dict['run_config'].setdefault(key, value)
 
     return config_dict
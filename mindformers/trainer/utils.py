@@ -15,8 +15,15 @@
 """Trainer Utils."""
 import os
 import random
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 import numpy as np
 
 from mindspore import context, load_checkpoint, load_param_into_net
@@ -268,11 +275,90 @@ def config2dict(config):
     return new_dict
 
 
+# the FICLONE ioctl of linux, which makes the destination file a copy-on-write clone of the source file
+_FICLONE = 0x40049409
+
+
+def _clone_or_copy_file(src_path: str, dst_path: str):
+    """Clone the file with a reflink where the filesystem supports it, so the data blocks are shared
+    until one of the files is written, otherwise copy the data."""
+    if fcntl is not None:
+        try:
+            with open(src_path, 'rb') as src_file, open(dst_path, 'wb') as dst_file:
+                fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+            shutil.copystat(src_path, dst_path)
+            return dst_path
+        except OSError:
+            pass
+    return shutil.copy2(src_path, dst_path)
+
+
+def copy_configs_directory(src_directory: str, dst_directory: str):
+    r"""Copy the configs directory of mindformers to the current working directory.
+    The directory is copied to a temporary path and renamed at last, so it never appears half copied.
+    The files are cloned instead of copied where the filesystem supports reflinks, unlike hard links
+    the clones are separate files, so editing them never changes the configs of mindformers.
+
+    Args:
+        src_directory (str): The configs directory of mindformers.
+        dst_directory (str): The configs directory of the current working directory.
+    """
+    tmp_directory = '{}.tmp{}'.format(dst_directory, os.getpid())
+    shutil.copytree(src_directory, tmp_directory, copy_function=_clone_or_copy_file)
+    try:
+        os.rename(tmp_directory, dst_directory)
+    except OSError:
+        # the configs directory has been created by another process meanwhile, such as the yaml files saved
+        # by the other ranks, the copied files are moved into it without replacing the existing ones
+        logger.warning("The configs directory %s has been created by another process, "
+                       "the missing config files are merged into it.", dst_directory)
+        _merge_directory(tmp_directory, dst_directory)
+        shutil.rmtree(tmp_directory, ignore_errors=True)
+
+
+def _merge_directory(src_directory: str, dst_directory: str):
+    """Move the files of the source directory to the same paths under the destination directory,
+    the files existing in the destination directory are kept."""
+    for root, _, files in os.walk(src_directory):
+        dst_root = os.path.join(dst_directory, os.path.relpath(root, src_directory))
+        os.makedirs(dst_root, exist_ok=True)
+        for file in files:
+            dst_path = os.path.join(dst_root, file)
+            if not os.path.exists(dst_path):
+                os.rename(os.path.join(root, file), dst_path)
+
+
 def load_distributed_checkpoint():
     """Load Checkpoint in Parallel Mode."""
 
 
-def resume_checkpoint_for_training(config, network, optimizer):
+def _has_optimizer_state(checkpoint_dict, network, optimizer):
+    """Whether the checkpoint contains the parameters owned by the optimizer only, such as the adam moments."""
+    if optimizer is None:
+        return False
+    network_param_names = {param.name for param in network.get_parameters()}
+    return any(param.name in checkpoint_dict and param.name not in network_param_names
+               for param in optimizer.get_parameters())
+
+
+def prefetch_checkpoint_for_training(config):
+    """Read the resume checkpoint in a background thread, so the reading overlaps the building of the network.
+
+    Returns:
+        The future of the checkpoint dict, None if the checkpoint is not read in advance.
+    """
+    if not config.resume_or_finetune_checkpoint or not os.path.isfile(config.resume_or_finetune_checkpoint):
+        return None
+    if context.get_auto_parallel_context('parallel_mode') in \
+            ['semi_auto_parallel', 'auto_parallel', 'hybrid_parallel']:
+        return None
+    executor = ThreadPoolExecutor(max_workers=1)
+    checkpoint_future = executor.submit(load_checkpoint, config.resume_or_finetune_checkpoint)
+    executor.shutdown(wait=False)
+    return checkpoint_future
+
+
+def resume_checkpoint_for_training(config, network, optimizer, checkpoint_future=None):
     """Resume Checkpoint for training."""
     if not os.path.realpath(config.resume_or_finetune_checkpoint) or \
             not os.path.exists(config.resume_or_finetune_checkpoint):
@@ -282,11 +368,17 @@ def resume_checkpoint_for_training(config, network, optimizer):
             ['semi_auto_parallel', 'auto_parallel', 'hybrid_parallel']:
         load_distributed_checkpoint()
     else:
-        checkpoint_dict = load_checkpoint(config.resume_or_finetune_checkpoint)
+        if checkpoint_future is not None:
+            checkpoint_dict = checkpoint_future.result()
+        else:
+            checkpoint_dict = load_checkpoint(config.resume_or_finetune_checkpoint)
         not_load_network_params = load_param_into_net(network, checkpoint_dict)
-        not_load_optim_params = load_param_into_net(optimizer, checkpoint_dict)
         logger.info("Not load network parameters is：%s", str(not_load_network_params))
-        logger.info("Not load optimizer parameters is：%s", str(not_load_optim_params))
+        if _has_optimizer_state(checkpoint_dict, network, optimizer):
+            not_load_optim_params = load_param_into_net(optimizer, checkpoint_dict)
+            logger.info("Not load optimizer parameters is：%s", str(not_load_optim_params))
+        else:
+            logger.info("The checkpoint has no optimizer state, the optimizer is not loaded.")
 
 
 def load_distributed_checkpoint_v2(config, model, dataset):
@@ -317,9 +409,12 @@ def resume_checkpoint_for_training_v2(config, model, network, optimizer, dataset
     else:
         checkpoint_dict = load_checkpoint(config.resume_or_finetune_checkpoint)
     not_load_network_params = load_param_into_net(network, checkpoint_dict)
-    not_load_optim_params = load_param_into_net(optimizer, checkpoint_dict)
     logger.info("Network parameters are not loaded：%s", str(not_load_network_params))
-    logger.info("Optimizer parameters are not loaded：%s", str(not_load_optim_params))
+    if _has_optimizer_state(checkpoint_dict, network, optimizer):
+        not_load_optim_params = load_param_into_net(optimizer, checkpoint_dict)
+        logger.info("Optimizer parameters are not loaded：%s", str(not_load_optim_params))
+    else:
+        logger.info("The checkpoint has no optimizer state, the optimizer is not loaded.")
 
 
 def get_last_checkpoint(checkpoint_dir):
@@ -0,0 +1,123 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test module for testing the translation dataset used for the t5 model.
+How to run this:
+pytest tests/st/test_model/test_t5_model/test_t5_dataset.py
+"""
+import os
+import shutil
+
+import numpy as np
+import pytest
+from mindspore.dataset import MindDataset
+
+from mindformers import T5Tokenizer
+from mindformers.dataset import TranslationDataset
+from mindformers.dataset.translation_dataset import _tokenize_batch, _tokenize_row, _encode_prefix
+
+
+SOURCES = ["hello world", "the weather is good today", "a"]
+TARGETS = ["salut lume", "vremea este buna astazi", "b"]
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+class TestTranslationDataset:
+    """A test class for testing the tokenization of the translation dataset"""
+    def setup_method(self):
+        self.output_path = os.path.join(os.path.dirname(__file__), 'test_dataset_output')
+        os.makedirs(self.output_path, exist_ok=True)
+        self.tokenizer = T5Tokenizer.from_pretrained(os.path.dirname(__file__))
+        self.tokenizer_path = os.path.join(self.output_path, 'tokenizer')
+        self.tokenizer.save_pretrained(self.tokenizer_path)
+
+    def teardown_method(self):
+        shutil.rmtree(self.output_path)
+
+    def write_raw_text(self, stage='train'):
+        """Writes the source and target files read by the WMT16DataLoader"""
+        for suffix, texts in (('source', SOURCES), ('target', TARGETS)):
+            with open(os.path.join(self.output_path, f'{stage}.{suffix}'), 'w') as fp:
+                fp.write('\n'.join(texts) + '\n')
+
+    @pytest.mark.parametrize('prefix', [None, 'translate the English to Romanian:'])
+    def test_batch_tokenization_equals_row_tokenization(self, prefix):
+        """
+        Feature: The batched tokenization of the translation dataset
+        Description: Tokenize the texts batch by batch and row by row, with and without the prefix
+        Expectation: The input_ids, attention_mask and labels of both ways are equal
+        """
+        src_max_length, tgt_max_length = 12, 6
+        prefix_ids = _encode_prefix(self.tokenizer, prefix, src_max_length)
+        batch_outputs = _tokenize_batch(self.tokenizer, SOURCES, TARGETS, src_max_length, tgt_max_length, prefix_ids)
+        for i, (src, tgt) in enumerate(zip(SOURCES, TARGETS)):
+            row_outputs = _tokenize_row(self.tokenizer, src, tgt, src_max_length, tgt_max_length, prefix_ids)
+            for row_column, batch_column in zip(row_outputs, batch_outputs):
+                assert batch_column.dtype == np.int32
+                assert np.array_equal(row_column, batch_column[i])
+        assert batch_outputs[0].shape == (len(SOURCES), src_max_length)
+        assert batch_outputs[2].shape == (len(TARGETS), tgt_max_length)
+
+    @pytest.mark.parametrize('src_max_length', [12, 32])
+    def test_prefix_ids_equal_joint_tokenization(self, src_max_length):
+        """
+        Feature: The prefix encoding of the translation dataset
+        Description: Tokenize the sources with the prefix ids and the joint string prefix + source as before,
+            the prefix ends with a space, otherwise its last word is glued to the first word of the source
+            in the joint string and is tokenized differently, while the prefix ids keep it a word of its own
+        Expectation: The input_ids and attention_mask of both ways are equal
+        """
+        prefix = 'translate the English to Romanian: '
+        prefix_ids = _encode_prefix(self.tokenizer, prefix, src_max_length)
+        batch_outputs = _tokenize_batch(self.tokenizer, SOURCES, TARGETS, src_max_length, 6, prefix_ids)
+        for i, src in enumerate(SOURCES):
+            joint_output = self.tokenizer(prefix + src, padding='max_length', max_length=src_max_length,
+                                          truncation=True)
+            assert np.array_equal(batch_outputs[0][i], joint_output['input_ids'])
+            assert np.array_equal(batch_outputs[1][i], joint_output['attention_mask'])
+
+    def test_too_long_prefix(self):
+        """
+        Feature: The prefix encoding of the translation dataset
+        Description: Encode a prefix which is not shorter than src_max_length
+        Expectation: ValueError
+        """
+        with pytest.raises(ValueError):
+            _encode_prefix(self.tokenizer, 'translate the English to Romanian:', 2)
+
+    def test_pretokenize_to_mindrecord(self):
+        """
+        Feature: TranslationDataset.pretokenize_to_mindrecord
+        Description: Pretokenize the raw text to the mindrecord file and read it back
+        Expectation: The records are equal to the batch tokenization of the raw text
+        """
+        self.write_raw_text()
+        output_file = os.path.join(self.output_path, 'wmt16.mindrecord')
+        tokenizer_config = {'type': self.tokenizer_path, 'prefix': 'translate:',
+                            'src_max_length': 16, 'tgt_max_length': 8}
+        TranslationDataset.pretokenize_to_mindrecord(self.output_path, tokenizer_config, output_file,
+                                                     num_workers=1, chunk_size=2)
+
+        prefix_ids = _encode_prefix(self.tokenizer, 'translate:', 16)
+        expected = _tokenize_batch(self.tokenizer, SOURCES, TARGETS, 16, 8, prefix_ids)
+        dataset = MindDataset(output_file, columns_list=['input_ids', 'attention_mask', 'labels'], shuffle=False)
+        records = list(dataset.create_tuple_iterator(output_numpy=True))
+        assert len(records) == len(SOURCES)
+        for i, record in enumerate(records):
+            for column, expected_column in zip(record, expected):
+                assert column.dtype == np.int32
+                assert np.array_equal(column, expected_column[i])
@@ -0,0 +1,105 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test Module for testing the yaml file written by the save_pretrained
+functions of ViTConfig and ViTProcessor
+
+How to run this:
+linux:  pytest ./tests/st/test_model/test_vit_model/test_vit_save_pretrained.py
+"""
+import os
+import shutil
+
+import pytest
+import yaml
+
+from mindformers.models import ViTConfig, ViTImageProcessor, ViTProcessor
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+class TestViTSavePretrained:
+    """A test class for testing the yaml file saved by ViTConfig.save_pretrained"""
+    def setup_method(self):
+        self.save_directory = os.path.join(os.path.dirname(__file__), 'test_save_pretrained_output')
+        os.makedirs(self.save_directory, exist_ok=True)
+        self.save_path = os.path.join(self.save_directory, 'vit_base_p16.yaml')
+
+    def teardown_method(self):
+        shutil.rmtree(self.save_directory)
+
+    def load_saved_yaml(self):
+        with open(self.save_path, 'r') as file_reader:
+            return yaml.load(file_reader, Loader=yaml.Loader)
+
+    def test_merge_into_processor_yaml(self):
+        """
+        Feature: ViTConfig.save_pretrained
+        Description: Save the config into the yaml file saved by the processor, which has python tags
+        Expectation: The processor section is kept and the model section is added after it
+        """
+        processor = ViTProcessor(ViTImageProcessor(size=(224, 224)))
+        processor.save_pretrained(self.save_directory, save_name='vit_base_p16')
+        with open(self.save_path, 'r') as file_reader:
+            assert '!!python/tuple' in file_reader.read()
+        processor_section = self.load_saved_yaml()['processor']
+
+        ViTConfig().save_pretrained(self.save_directory, save_name='vit_base_p16')
+
+        saved = self.load_saved_yaml()
+        assert list(saved.keys()) == ['processor', 'model']
+        assert saved['processor'] == processor_section
+        assert saved['model']['model_config']['type'] == 'ViTConfig'
+
+    def test_config_is_unchanged_after_save(self):
+        """
+        Feature: ViTConfig.save_pretrained
+        Description: Save the config with a model_name twice
+        Expectation: The config is not changed, model_name is saved as the arch type in both saves
+        """
+        config = ViTConfig()
+        config.model_name = 'vit_base_p16'
+        expected = dict(config)
+        for _ in range(2):
+            config.save_pretrained(self.save_directory, save_name='vit_base_p16')
+            assert dict(config) == expected
+            assert 'type' not in config
+
+            saved = self.load_saved_yaml()
+            assert saved['model']['arch']['type'] == 'vit_base_p16'
+            assert saved['model']['model_config']['type'] == 'ViTConfig'
+            assert 'model_name' not in saved['model']['model_config']
+
+    @pytest.mark.parametrize('merge', [True, False])
+    def test_merge_with_existing_yaml(self, merge):
+        """
+        Feature: ViTConfig.save_pretrained
+        Description: Save the config into an existing yaml file with merge on and off
+        Expectation: The other sections are kept when merging and dropped when overwriting
+        """
+        with open(self.save_path, 'w') as file_pointer:
+            yaml.dump({'processor': {'type': 'ViTProcessor'}, 'model': {'arch': {'type': 'old'}}},
+                      file_pointer, sort_keys=False)
+
+        ViTConfig().save_pretrained(self.save_directory, save_name='vit_base_p16', merge=merge)
+
+        saved = self.load_saved_yaml()
+        if merge:
+            assert list(saved.keys()) == ['processor', 'model']
+            assert saved['processor'] == {'type': 'ViTProcessor'}
+        else:
+            assert list(saved.keys()) == ['model']
+        assert saved['model']['model_config']['type'] == 'ViTConfig'
@@ -0,0 +1,159 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test module for testing the input loading and the pipeline cache of ImageClassificationTrainer.predict.
+
+How to run this:
+linux:
+pytest ./tests/st/test_trainer/test_image_classification_trainer/test_trainer_predict.py
+"""
+import os
+import shutil
+
+import numpy as np
+import pytest
+from PIL import Image
+from mindspore import nn
+
+from mindformers.tools.register import MindFormerConfig
+from mindformers.trainer.image_classification import image_classification
+from mindformers.trainer.image_classification.image_classification import ImageClassificationTrainer, \
+    _PREDICT_INPUT_LOADERS, _batch_single_input, _predict_in_batches
+
+
+class FakeImageProcessor:
+    """An image processor which is only used as a part of the pipeline cache key."""
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+class TestImageClassificationPredict:
+    """A test class for testing ImageClassificationTrainer.predict"""
+    def setup_method(self):
+        self.output_path = os.path.join(os.path.dirname(__file__), 'test_predict_output')
+        os.makedirs(self.output_path, exist_ok=True)
+        self.image_paths = []
+        for index in range(3):
+            image_path = os.path.join(self.output_path, f"test_image_{index}.png")
+            Image.fromarray(np.full((8, 8, 3), index, np.uint8)).save(image_path)
+            self.image_paths.append(image_path)
+
+    def teardown_method(self):
+        shutil.rmtree(self.output_path)
+
+    def test_load_str_input(self):
+        """
+        Feature: The input loading of ImageClassificationTrainer.predict
+        Description: Load the path of a single image
+        Expectation: A batch of the single RGB image
+        """
+        batch = _PREDICT_INPUT_LOADERS[str](self.image_paths[0])
+        assert len(batch) == 1
+        assert batch[0].dtype == np.uint8
+        assert np.array_equal(batch[0], np.full((8, 8, 3), 0, np.uint8))
+
+    @pytest.mark.parametrize('num_io_workers', [None, 1])
+    def test_load_list_input(self, num_io_workers):
+        """
+        Feature: The input loading of ImageClassificationTrainer.predict
+        Description: Load a list of image paths in the threads and in the caller
+        Expectation: The images are stacked into one array in the order of the paths
+        """
+        batch = _PREDICT_INPUT_LOADERS[list](self.image_paths, num_io_workers)
+        assert batch.shape == (3, 8, 8, 3)
+        assert batch.dtype == np.uint8
+        for index in range(3):
+            assert np.all(batch[index] == index)
+
+    def test_batch_array_input(self):
+        """
+        Feature: The input loading of ImageClassificationTrainer.predict
+        Description: Batch a single decoded image and a batched array
+        Expectation: The single image gets a batch dim, the batched array is kept
+        """
+        image = np.zeros((8, 8, 3), np.uint8)
+        assert _batch_single_input(image).shape == (1, 8, 8, 3)
+        images = np.zeros((2, 8, 8, 3), np.uint8)
+        assert _batch_single_input(images) is images
+
+    def test_pipeline_cache(self, monkeypatch):
+        """
+        Feature: The pipeline cache of ImageClassificationTrainer.predict
+        Description: Predict with the same network twice, then with another network and with the first one again
+        Expectation: The pipeline is built on the cache misses only, just the last pipeline is kept
+        """
+        built_models = []
+
+        def fake_pipeline(task, model, image_processor, **kwargs):
+            built_models.append(model)
+            return lambda images: [[{"score": 1.0, "label": task}] for _ in images]
+
+        monkeypatch.setattr(image_classification, "pipeline", fake_pipeline)
+        trainer = ImageClassificationTrainer(model_name='vit_base_p16')
+        first_network, second_network = nn.Dense(2, 2), nn.Dense(2, 2)
+        image_processor = FakeImageProcessor()
+        images = np.zeros((2, 8, 8, 3), np.uint8)
+
+        for network in (first_network, first_network, second_network, first_network):
+            output = trainer.predict(input_data=images, network=network, image_processor=image_processor)
+            assert len(output) == 2
+
+        assert built_models == [first_network, second_network, first_network]
+
+    def test_predict_config_is_reset(self, monkeypatch):
+        """
+        Feature: The default config cache of ImageClassificationTrainer.predict
+        Description: Predict with the default config, replace trainer.config and predict again
+        Expectation: The default config is resolved again and the pipeline is rebuilt
+        """
+        built_models = []
+
+        def fake_pipeline(task, model, image_processor, **kwargs):
+            built_models.append(model)
+            return lambda images: [[{"score": 1.0, "label": task}] for _ in images]
+
+        monkeypatch.setattr(image_classification, "pipeline", fake_pipeline)
+        trainer = ImageClassificationTrainer(model_name='vit_base_p16')
+        network, image_processor = nn.Dense(2, 2), FakeImageProcessor()
+        images = np.zeros((2, 8, 8, 3), np.uint8)
+
+        trainer.predict(input_data=images, network=network, image_processor=image_processor)
+        first_config = trainer.config
+        trainer.predict(input_data=images, network=network, image_processor=image_processor)
+        assert trainer.config is first_config
+        assert len(built_models) == 1
+
+        trainer.config = MindFormerConfig(**first_config)
+        trainer.predict(input_data=images, network=network, image_processor=image_processor)
+        assert trainer.config is not first_config
+        assert len(built_models) == 2
+
+    def test_predict_in_batches(self):
+        """
+        Feature: The chunked prediction of ImageClassificationTrainer.predict
+        Description: Predict 5 images in the chunks of 2 images
+        Expectation: Every chunk has 2 images, the results of the 5 images are returned in order
+        """
+        chunk_shapes = []
+
+        def fake_pipeline_task(images):
+            chunk_shapes.append(images.shape)
+            return [int(image[0, 0, 0]) for image in images]
+
+        images = np.stack([np.full((8, 8, 3), index, np.uint8) for index in range(5)])
+        output = _predict_in_batches(fake_pipeline_task, images, batch_size=2)
+        assert output == [0, 1, 2, 3, 4]
+        assert chunk_shapes == [(2, 8, 8, 3)] * 3
@@ -0,0 +1,74 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test module for testing the config split of the trainer for saving.
+How to run this:
+pytest tests/st/test_trainer/test_trainer_save_config.py
+"""
+import copy
+
+import pytest
+
+from mindformers.tools.register.config import MindFormerConfig
+from mindformers.trainer.trainer import _reset_config_for_save
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_reset_config_for_save():
+    """
+    Feature: Split the task config into the yaml files to save
+    Description: Route every section of the task config to its yaml file
+    Expectation: The sections are routed to the expected files and the input config is not changed
+    """
+    raw_config = {
+        'seed': 0,
+        'run_mode': 'train',
+        'model': {'arch': {'type': 'T5ForConditionalGeneration'}, 'model_config': {'vocab_size': 32}},
+        'processor': {'type': 'T5Processor'},
+        'train_dataset': {'batch_size': 1, 'data_loader': {'type': 'MindDataset'}},
+        'train_dataset_task': {'type': 'TranslationDataset'},
+        'eval_dataset': {'batch_size': 2},
+        'eval_dataset_task': {'type': 'TranslationDataset'},
+        'context': {'mode': 0},
+        'parallel': {'parallel_mode': 0},
+        'moe_config': {'expert_num': 1},
+        'recompute_config': {'recompute': False},
+        'parallel_config': {'data_parallel': 1},
+        'runner_config': {'epochs': 1},
+        'runner_wrapper': {'type': 'TrainOneStepCell'},
+        'optimizer': {'type': 'AdamWeightDecay'},
+        'lr_schedule': {'type': 'WarmUpLR'},
+        'callbacks': [{'type': 'MFLossMonitor'}],
+        'profile': None,
+    }
+    config = MindFormerConfig(**copy.deepcopy(raw_config))
+    config_dict = _reset_config_for_save(config, model_name='t5_small')
+
+    assert list(config_dict['model_config'].keys()) == ['model', 'processor']
+    assert list(config_dict['dataset_config'].keys()) == \
+        ['train_dataset', 'train_dataset_task', 'eval_dataset', 'eval_dataset_task']
+    assert list(config_dict['context_config'].keys()) == \
+        ['context', 'parallel', 'moe_config', 'recompute_config', 'parallel_config']
+    assert list(config_dict['runner_config'].keys()) == \
+        ['runner_config', 'runner_wrapper', 'optimizer', 'lr_schedule', 'callbacks']
+    assert list(config_dict['run_config'].keys()) == ['base_config', 'seed', 'run_mode', 'profile']
+    assert config_dict['run_config']['base_config'][-1] == './model_config/t5_small.yaml'
+    assert config_dict['dataset_config']['eval_dataset'] == raw_config['eval_dataset']
+    assert config_dict['model_config']['model'] == raw_config['model']
+    assert not isinstance(config_dict['model_config']['model']['arch'], MindFormerConfig)
+
+    assert config == MindFormerConfig(**raw_config)
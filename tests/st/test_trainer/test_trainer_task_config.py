@@ -0,0 +1,45 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test module for testing the default task config shared by the trainers of the same task.
+How to run this:
+pytest tests/st/test_trainer/test_trainer_task_config.py
+"""
+import pytest
+
+from mindformers.tools.register.config import MindFormerConfig
+from mindformers.trainer import Trainer
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+def test_trainers_of_the_same_task():
+    """
+    Feature: The cached default task config of Trainer
+    Description: Build two trainers for the same task and model, and change the config of the first one
+    Expectation: Each trainer has its own config, the change is not seen by the second trainer
+    """
+    first = Trainer(task='image_classification', model='vit_base_p16')
+    default_batch_size = first.config.runner_config.batch_size
+    default_num_callbacks = len(first.config.callbacks)
+    first.config.runner_config.batch_size = default_batch_size + 1
+    first.config.callbacks.pop()
+
+    second = Trainer(task='image_classification', model='vit_base_p16')
+    assert second.config is not first.config
+    assert isinstance(second.config.runner_config, MindFormerConfig)
+    assert second.config.runner_config.batch_size == default_batch_size
+    assert len(second.config.callbacks) == default_num_callbacks
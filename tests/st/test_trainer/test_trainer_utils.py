@@ -0,0 +1,78 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Test module for testing the copy of the configs directory used by the trainers.
+How to run this:
+pytest tests/st/test_trainer/test_trainer_utils.py
+"""
+import os
+import shutil
+
+import pytest
+
+from mindformers.trainer.utils import copy_configs_directory
+
+
+def write_file(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as fp:
+        fp.write(content)
+
+
+def read_file(path):
+    with open(path, 'r') as fp:
+        return fp.read()
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+class TestCopyConfigsDirectory:
+    """A test class for testing copy_configs_directory"""
+    def setup_method(self):
+        self.output_path = os.path.join(os.path.dirname(__file__), 'test_copy_configs_output')
+        self.src_directory = os.path.join(self.output_path, 'src')
+        self.dst_directory = os.path.join(self.output_path, 'configs')
+        write_file(os.path.join(self.src_directory, 'vit', 'run_vit.yaml'), 'src vit')
+        write_file(os.path.join(self.src_directory, 'bert', 'run_bert.yaml'), 'src bert')
+
+    def teardown_method(self):
+        shutil.rmtree(self.output_path)
+
+    def test_copy_to_new_directory(self):
+        """
+        Feature: copy_configs_directory
+        Description: Copy the configs to a directory which does not exist
+        Expectation: The files are copied and no temporary directory is left
+        """
+        copy_configs_directory(self.src_directory, self.dst_directory)
+        assert read_file(os.path.join(self.dst_directory, 'vit', 'run_vit.yaml')) == 'src vit'
+        assert read_file(os.path.join(self.dst_directory, 'bert', 'run_bert.yaml')) == 'src bert'
+        assert sorted(os.listdir(self.output_path)) == ['configs', 'src']
+
+    def test_merge_into_existing_directory(self):
+        """
+        Feature: copy_configs_directory
+        Description: Copy the configs to a directory created meanwhile by another rank saving its config
+        Expectation: The missing files are added, the existing files are kept and no temporary directory is left
+        """
+        write_file(os.path.join(self.dst_directory, 'vit', 'run_vit.yaml'), 'saved vit')
+        write_file(os.path.join(self.dst_directory, 'vit', 'vit_new.yaml'), 'saved new')
+
+        copy_configs_directory(self.src_directory, self.dst_directory)
+        assert read_file(os.path.join(self.dst_directory, 'vit', 'run_vit.yaml')) == 'saved vit'
+        assert read_file(os.path.join(self.dst_directory, 'vit', 'vit_new.yaml')) == 'saved new'
+        assert read_file(os.path.join(self.dst_directory, 'bert', 'run_bert.yaml')) == 'src bert'
+        assert sorted(os.listdir(self.output_path)) == ['configs', 'src']
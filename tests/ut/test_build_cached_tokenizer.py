@@ -0,0 +1,95 @@
+# Copyright 2023 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test build cached tokenizer."""
+import os
+import shutil
+
+import pytest
+
+from mindformers import BertTokenizer
+from mindformers.models.build_tokenizer import build_cached_tokenizer
+from mindformers.tools.register import MindFormerRegister, MindFormerModuleType, MindFormerConfig
+from mindformers.trainer.base_trainer import BaseTrainer
+
+
+@MindFormerRegister.register(MindFormerModuleType.TOKENIZER)
+class CachedTestTokenizer(BertTokenizer):
+    """The bert tokenizer whose vocab file is found by the build instead of the config."""
+    vocab_path = None
+
+    @classmethod
+    def get_support_list(cls):
+        return ['cached_test']
+
+    @classmethod
+    def cache_vocab_files(cls, name_or_path, cache_path=None):
+        return {'vocab_file': cls.vocab_path}
+
+
+@pytest.mark.level0
+@pytest.mark.platform_x86_cpu
+@pytest.mark.env_onecard
+class TestBuildCachedTokenizer:
+    """A test class for testing build_cached_tokenizer"""
+    def setup_method(self):
+        self.output_path = os.path.join(os.path.dirname(__file__), 'test_cached_tokenizer_output')
+        os.makedirs(self.output_path, exist_ok=True)
+        CachedTestTokenizer.vocab_path = os.path.join(self.output_path, 'vocab.txt')
+        with open(CachedTestTokenizer.vocab_path, 'w') as fp:
+            fp.write('\n'.join(["[PAD]", "[unused1]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "hello", "world"]))
+
+    def teardown_method(self):
+        shutil.rmtree(self.output_path)
+
+    def test_tokenizer_is_copied_per_caller(self):
+        """
+        Feature: build_cached_tokenizer
+        Description: Build the tokenizer twice with the same config and change an attribute of one of them
+        Expectation: The callers get different tokenizers sharing the vocab, the change is not shared
+        """
+        config = {'type': 'CachedTestTokenizer', 'vocab_file': CachedTestTokenizer.vocab_path}
+        first = build_cached_tokenizer(dict(config))
+        second = build_cached_tokenizer(dict(config))
+        assert first is not second
+        assert first.vocab_dict is second.vocab_dict
+        first.do_lower_case = False
+        assert second.do_lower_case
+        assert first("hello world")['input_ids'] == second("hello world")['input_ids']
+
+    def test_vocab_file_is_written_back(self):
+        """
+        Feature: build_cached_tokenizer
+        Description: Build the tokenizer from the configs without the vocab file, built and cached
+        Expectation: The vocab file found by the build is added to both configs as build_tokenizer does
+        """
+        for _ in range(2):
+            config = MindFormerConfig(type='CachedTestTokenizer')
+            build_cached_tokenizer(config)
+            assert config.vocab_file == CachedTestTokenizer.vocab_path
+
+    def test_create_tokenizer_of_trainers(self):
+        """
+        Feature: BaseTrainer.create_tokenizer
+        Description: Create the tokenizers of two trainers with the same tokenizer config
+        Expectation: Each trainer gets its own tokenizer and the vocab file in its own config
+        """
+        tokenizers = []
+        for _ in range(2):
+            trainer = BaseTrainer('general', 'common')
+            trainer.config = MindFormerConfig(processor={'tokenizer': {'type': 'CachedTestTokenizer'}})
+            tokenizers.append(trainer.create_tokenizer())
+            assert trainer.tokenizer is tokenizers[-1]
+            assert trainer.config.processor.tokenizer.vocab_file == CachedTestTokenizer.vocab_path
+        assert tokenizers[0] is not tokenizers[1]